@@ -4,10 +4,21 @@ Database storage module for CS 1.6 Master Server.
 Provides SQLite-based server list management.
 """
 
+import logging
+import mmap
 import sqlite3
 import os
+import re
+import threading
+import time
+import weakref
+from contextlib import contextmanager
 from typing import List, Tuple, Optional
-from datetime import datetime
+
+log = logging.getLogger(__name__)
+
+# "IP:PORT" import line; matched against raw mmap bytes
+_RE_SERVER = re.compile(rb'^\s*(\d{1,3}(?:\.\d{1,3}){3})\s*:\s*(\d{1,5})\s*$')
 
 
 class ServerDatabase:
@@ -19,19 +30,34 @@ class ServerDatabase:
         """Initialize database connection."""
         self.db_path = db_path
         self.conn = None
-        self.cursor = None
+        # Serializes write transactions on the shared connection
+        self._write_lock = threading.Lock()
+        # (enabled, total) server counts; reset by every write that changes them
+        self._count_cache: Optional[Tuple[int, int]] = None
         self._connect()
+        # Closes the connection if the object is collected without close()
+        self._finalizer = weakref.finalize(self, self.conn.close)
         self._create_tables()
     
     def _connect(self):
         """Connect to SQLite database."""
-        self.conn = sqlite3.connect(self.db_path, check_same_thread=False)
-        self.cursor = self.conn.cursor()
+        # Autocommit mode: no implicit BEGIN, writes go through _txn()
+        self.conn = sqlite3.connect(self.db_path, check_same_thread=False, isolation_level=None)
+        cursor = self.conn.cursor()
+        
+        # WAL lets GUI reads run alongside writes; NORMAL sync is safe under WAL
+        cursor.execute("PRAGMA journal_mode=WAL")
+        cursor.execute("PRAGMA synchronous=NORMAL")
+        cursor.execute("PRAGMA temp_store=MEMORY")
+        cursor.execute("PRAGMA cache_size=-65536")  # 64 MiB
+        cursor.execute("PRAGMA mmap_size=268435456")  # 256 MiB
+        cursor.execute("PRAGMA busy_timeout=5000")
     
     def _create_tables(self):
         """Create database tables if they don't exist."""
         # Servers table
-        self.cursor.execute("""
+        cursor = self.conn.cursor()
+        cursor.execute("""
             CREATE TABLE IF NOT EXISTS servers (
                 id INTEGER PRIMARY KEY AUTOINCREMENT,
                 ip TEXT NOT NULL,
@@ -44,8 +70,13 @@ class ServerDatabase:
             )
         """)
         
+        # Covers the enabled-only listing/count queries (ORDER BY id)
+        cursor.execute(
+            "CREATE INDEX IF NOT EXISTS idx_servers_enabled ON servers(enabled, id)"
+        )
+        
         # Statistics table (optional - for future use)
-        self.cursor.execute("""
+        cursor.execute("""
             CREATE TABLE IF NOT EXISTS server_stats (
                 id INTEGER PRIMARY KEY AUTOINCREMENT,
                 server_id INTEGER,
@@ -54,169 +85,191 @@ class ServerDatabase:
                 FOREIGN KEY (server_id) REFERENCES servers(id)
             )
         """)
-        
-        self.conn.commit()
+    
+    @contextmanager
+    def _txn(self):
+        """Run the enclosed writes in a single BEGIN IMMEDIATE ... COMMIT."""
+        with self._write_lock:
+            self.conn.execute("BEGIN IMMEDIATE")
+            try:
+                yield
+            except BaseException:
+                self.conn.execute("ROLLBACK")
+                raise
+            self.conn.execute("COMMIT")
     
     def add_server(self, ip: str, port: int, name: str = None, description: str = None) -> bool:
-        """Add a server to the database."""
+        """Add a server to the database. Returns False if it already exists."""
         try:
-            self.cursor.execute(
-                "INSERT INTO servers (ip, port, name, description) VALUES (?, ?, ?, ?)",
-                (ip, port, name, description)
-            )
-            self.conn.commit()
+            with self._txn():
+                cursor = self.conn.cursor()
+                cursor.execute(
+                    """INSERT INTO servers (ip, port, name, description) VALUES (?, ?, ?, ?)
+                       ON CONFLICT(ip, port) DO NOTHING""",
+                    (ip, port, name, description)
+                )
+            if cursor.rowcount != 1:
+                # Server already exists
+                return False
+            self._count_cache = None
             return True
-        except sqlite3.IntegrityError:
-            # Server already exists
-            return False
-        except Exception as e:
-            print(f"Error adding server: {e}")
+        except sqlite3.Error:
+            log.exception("Error adding server")
             return False
     
     def remove_server(self, ip: str, port: int) -> bool:
         """Remove a server from the database."""
         try:
-            self.cursor.execute(
-                "DELETE FROM servers WHERE ip = ? AND port = ?",
-                (ip, port)
-            )
-            self.conn.commit()
-            return self.cursor.rowcount > 0
-        except Exception as e:
-            print(f"Error removing server: {e}")
+            with self._txn():
+                cursor = self.conn.cursor()
+                cursor.execute(
+                    "DELETE FROM servers WHERE ip = ? AND port = ?",
+                    (ip, port)
+                )
+            self._count_cache = None
+            return cursor.rowcount > 0
+        except sqlite3.Error:
+            log.exception("Error removing server")
             return False
     
     def remove_server_by_id(self, server_id: int) -> bool:
         """Remove a server by ID."""
         try:
-            self.cursor.execute("DELETE FROM servers WHERE id = ?", (server_id,))
-            self.conn.commit()
-            return self.cursor.rowcount > 0
-        except Exception as e:
-            print(f"Error removing server: {e}")
+            with self._txn():
+                cursor = self.conn.cursor()
+                cursor.execute("DELETE FROM servers WHERE id = ?", (server_id,))
+            self._count_cache = None
+            return cursor.rowcount > 0
+        except sqlite3.Error:
+            log.exception("Error removing server")
             return False
     
     def get_all_servers(self, enabled_only: bool = True) -> List[Tuple[str, int]]:
         """Get all servers from database."""
         try:
+            cursor = self.conn.cursor()
             if enabled_only:
-                self.cursor.execute(
+                cursor.execute(
                     "SELECT ip, port FROM servers WHERE enabled = 1 ORDER BY id"
                 )
             else:
-                self.cursor.execute(
+                cursor.execute(
                     "SELECT ip, port FROM servers ORDER BY id"
                 )
-            return self.cursor.fetchall()
-        except Exception as e:
-            print(f"Error getting servers: {e}")
+            return cursor.fetchall()
+        except sqlite3.Error:
+            log.exception("Error getting servers")
             return []
     
     def get_servers_detailed(self) -> List[dict]:
         """Get all servers with detailed information."""
         try:
-            self.cursor.execute(
+            # Row factory on this cursor only; other queries keep returning plain tuples
+            cursor = self.conn.cursor()
+            cursor.row_factory = sqlite3.Row
+            cursor.execute(
                 """SELECT id, ip, port, name, description, added_date, enabled 
                    FROM servers ORDER BY id"""
             )
-            rows = self.cursor.fetchall()
-            servers = []
-            for row in rows:
-                servers.append({
-                    'id': row[0],
-                    'ip': row[1],
-                    'port': row[2],
-                    'name': row[3],
-                    'description': row[4],
-                    'added_date': row[5],
-                    'enabled': bool(row[6])
-                })
-            return servers
-        except Exception as e:
-            print(f"Error getting detailed servers: {e}")
+            return [dict(row, enabled=bool(row['enabled'])) for row in cursor.fetchall()]
+        except sqlite3.Error:
+            log.exception("Error getting detailed servers")
             return []
     
     def update_server(self, ip: str, port: int, name: str = None, description: str = None) -> bool:
         """Update server information."""
         try:
-            self.cursor.execute(
-                "UPDATE servers SET name = ?, description = ? WHERE ip = ? AND port = ?",
-                (name, description, ip, port)
-            )
-            self.conn.commit()
-            return self.cursor.rowcount > 0
-        except Exception as e:
-            print(f"Error updating server: {e}")
+            with self._txn():
+                cursor = self.conn.cursor()
+                cursor.execute(
+                    "UPDATE servers SET name = ?, description = ? WHERE ip = ? AND port = ?",
+                    (name, description, ip, port)
+                )
+            return cursor.rowcount > 0
+        except sqlite3.Error:
+            log.exception("Error updating server")
             return False
     
     def toggle_server(self, ip: str, port: int, enabled: bool) -> bool:
         """Enable or disable a server."""
         try:
-            self.cursor.execute(
-                "UPDATE servers SET enabled = ? WHERE ip = ? AND port = ?",
-                (1 if enabled else 0, ip, port)
-            )
-            self.conn.commit()
-            return self.cursor.rowcount > 0
-        except Exception as e:
-            print(f"Error toggling server: {e}")
+            with self._txn():
+                cursor = self.conn.cursor()
+                cursor.execute(
+                    "UPDATE servers SET enabled = ? WHERE ip = ? AND port = ?",
+                    (1 if enabled else 0, ip, port)
+                )
+            self._count_cache = None
+            return cursor.rowcount > 0
+        except sqlite3.Error:
+            log.exception("Error toggling server")
             return False
     
     def server_exists(self, ip: str, port: int) -> bool:
         """Check if a server exists in the database."""
         try:
-            self.cursor.execute(
-                "SELECT COUNT(*) FROM servers WHERE ip = ? AND port = ?",
+            cursor = self.conn.cursor()
+            cursor.execute(
+                "SELECT 1 FROM servers WHERE ip = ? AND port = ? LIMIT 1",
                 (ip, port)
             )
-            count = self.cursor.fetchone()[0]
-            return count > 0
-        except Exception as e:
-            print(f"Error checking server: {e}")
+            return cursor.fetchone() is not None
+        except sqlite3.Error:
+            log.exception("Error checking server")
             return False
     
     def get_server_count(self, enabled_only: bool = True) -> int:
         """Get total number of servers."""
-        try:
-            if enabled_only:
-                self.cursor.execute("SELECT COUNT(*) FROM servers WHERE enabled = 1")
-            else:
-                self.cursor.execute("SELECT COUNT(*) FROM servers")
-            return self.cursor.fetchone()[0]
-        except Exception as e:
-            print(f"Error counting servers: {e}")
-            return 0
+        if self._count_cache is None:
+            try:
+                cursor = self.conn.cursor()
+                cursor.execute(
+                    "SELECT COALESCE(SUM(enabled = 1), 0), COUNT(*) FROM servers"
+                )
+                self._count_cache = cursor.fetchone()
+            except sqlite3.Error:
+                log.exception("Error counting servers")
+                return 0
+        
+        enabled, total = self._count_cache
+        return enabled if enabled_only else total
     
     def import_from_file(self, file_path: str) -> Tuple[int, int]:
         """Import servers from text file. Returns (added, skipped)."""
-        added = 0
-        skipped = 0
+        rows = []
+        malformed = 0
         
         try:
-            with open(file_path, 'r', encoding='utf-8') as f:
-                for line in f:
-                    line = line.strip()
-                    if not line or line.startswith('#'):
-                        continue
-                    
-                    if ':' not in line:
-                        continue
-                    
-                    try:
-                        ip, port_str = line.split(':', 1)
-                        ip = ip.strip()
-                        port = int(port_str.strip())
-                        
-                        if self.add_server(ip, port):
-                            added += 1
-                        else:
-                            skipped += 1
-                    except Exception:
-                        skipped += 1
-        except Exception as e:
-            print(f"Error importing from file: {e}")
+            # Map the file and scan raw bytes; only the surviving IP text is decoded
+            with open(file_path, 'rb') as f:
+                if os.fstat(f.fileno()).st_size:
+                    with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as data:
+                        for line in iter(data.readline, b''):
+                            line = line.strip()
+                            if not line or line[:1] == b'#' or b':' not in line:
+                                continue
+                            
+                            m = _RE_SERVER.match(line)
+                            if not m:
+                                malformed += 1
+                                continue
+                            rows.append((m.group(1).decode('ascii'), int(m.group(2)), None, None))
+            
+            # One transaction for the whole file instead of a commit per row
+            with self._txn():
+                cursor = self.conn.cursor()
+                cursor.executemany(
+                    """INSERT INTO servers (ip, port, name, description) VALUES (?, ?, ?, ?)
+                       ON CONFLICT(ip, port) DO NOTHING""",
+                    rows
+                )
+            self._count_cache = None
+            added = cursor.rowcount
+        except (OSError, ValueError, sqlite3.Error):
+            log.exception("Error importing from file")
+            return 0, len(rows) + malformed
         
-        return added, skipped
+        return added, len(rows) - added + malformed
     
     def export_to_file(self, file_path: str) -> bool:
         """Export servers to text file."""
@@ -224,34 +277,42 @@ class ServerDatabase:
             servers = self.get_all_servers(enabled_only=False)
             with open(file_path, 'w', encoding='utf-8') as f:
                 f.write("# CS 1.6 Server List\n")
-                f.write(f"# Exported from database on {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}\n")
+                f.write(f"# Exported from database on {time.strftime('%Y-%m-%d %H:%M:%S')}\n")
                 f.write("# Format: IP:PORT\n\n")
-                
-                for ip, port in servers:
-                    f.write(f"{ip}:{port}\n")
+                if servers:
+                    f.write("\n".join(f"{ip}:{port}" for ip, port in servers))
+                    f.write("\n")
             
             return True
-        except Exception as e:
-            print(f"Error exporting to file: {e}")
+        except (OSError, sqlite3.Error):
+            log.exception("Error exporting to file")
             return False
     
     def clear_all(self) -> bool:
         """Remove all servers from database."""
         try:
-            self.cursor.execute("DELETE FROM servers")
-            self.conn.commit()
+            with self._txn():
+                cursor = self.conn.cursor()
+                cursor.execute("DELETE FROM servers")
+            self._count_cache = None
             return True
-        except Exception as e:
-            print(f"Error clearing database: {e}")
+        except sqlite3.Error:
+            log.exception("Error clearing database")
             return False
     
     def close(self):
         """Close database connection."""
         if self.conn:
-            self.conn.close()
+            try:
+                self.conn.execute("PRAGMA optimize")
+            except sqlite3.Error:
+                pass
+            self._finalizer()
+    
+    def __enter__(self):
+        return self
     
-    def __del__(self):
-        """Destructor to ensure connection is closed."""
+    def __exit__(self, exc_type, exc, tb):
         self.close()
 
 
@@ -4,17 +4,28 @@ Custom dialog windows for CS 1.6 Master Server GUI.
 Includes add server, edit config, about, and error alert dialogs.
 """
 
+import ipaddress
 import tkinter as tk
 from tkinter import ttk, messagebox, filedialog
 from typing import Optional, Tuple
 from theme import Colors, Fonts, Layout, Icons
 
+# Font tuples shared by every dialog instead of being rebuilt per widget
+_FONT_SMALL = (Fonts.FAMILY_DEFAULT, Fonts.SIZE_SMALL)
+_FONT_NORMAL = (Fonts.FAMILY_DEFAULT, Fonts.SIZE_NORMAL)
+_FONT_MEDIUM = (Fonts.FAMILY_DEFAULT, Fonts.SIZE_MEDIUM)
+_FONT_HEADER = (Fonts.FAMILY_DEFAULT, Fonts.SIZE_HEADER, Fonts.WEIGHT_BOLD)
+
 
 class AddServerDialog(tk.Toplevel):
     """
     Dialog for adding a new server to the list.
+    
+    A single hidden instance is reused between opens; use AddServerDialog.get().
     """
     
+    _instance: Optional["AddServerDialog"] = None
+    
     def __init__(self, parent):
         super().__init__(parent)
         
@@ -27,6 +38,7 @@ class AddServerDialog(tk.Toplevel):
         self.grab_set()
         
         self.result: Optional[Tuple[str, int]] = None
+        self._closed = tk.BooleanVar(value=False)
         
         # Create widgets
         main_frame = tk.Frame(self, padx=Layout.PADDING_LARGE, pady=Layout.PADDING_LARGE)
@@ -36,14 +48,14 @@ class AddServerDialog(tk.Toplevel):
         tk.Label(
             main_frame,
             text="IP Address:",
-            font=(Fonts.FAMILY_DEFAULT, Fonts.SIZE_NORMAL)
+            font=_FONT_NORMAL
         ).grid(row=0, column=0, sticky=tk.W, pady=5)
         
         self.ip_var = tk.StringVar()
         self.ip_entry = tk.Entry(
             main_frame,
             textvariable=self.ip_var,
-            font=(Fonts.FAMILY_DEFAULT, Fonts.SIZE_NORMAL),
+            font=_FONT_NORMAL,
             width=30
         )
         self.ip_entry.grid(row=0, column=1, pady=5, padx=(10, 0))
@@ -53,14 +65,14 @@ class AddServerDialog(tk.Toplevel):
         tk.Label(
             main_frame,
             text="Port:",
-            font=(Fonts.FAMILY_DEFAULT, Fonts.SIZE_NORMAL)
+            font=_FONT_NORMAL
         ).grid(row=1, column=0, sticky=tk.W, pady=5)
         
         self.port_var = tk.StringVar(value="27015")
         self.port_entry = tk.Entry(
             main_frame,
             textvariable=self.port_var,
-            font=(Fonts.FAMILY_DEFAULT, Fonts.SIZE_NORMAL),
+            font=_FONT_NORMAL,
             width=30
         )
         self.port_entry.grid(row=1, column=1, pady=5, padx=(10, 0))
@@ -69,7 +81,7 @@ class AddServerDialog(tk.Toplevel):
         self.validation_label = tk.Label(
             main_frame,
             text="",
-            font=(Fonts.FAMILY_DEFAULT, Fonts.SIZE_SMALL),
+            font=_FONT_SMALL,
             fg=Colors.ERROR
         )
         self.validation_label.grid(row=2, column=0, columnspan=2, pady=5)
@@ -102,6 +114,23 @@ class AddServerDialog(tk.Toplevel):
         # Bind Enter and Escape
         self.bind("<Return>", lambda e: self.on_ok())
         self.bind("<Escape>", lambda e: self.on_cancel())
+        self.protocol("WM_DELETE_WINDOW", self.on_cancel)
+    
+    @classmethod
+    def get(cls, parent) -> "AddServerDialog":
+        """Return the shared dialog, creating it on first use."""
+        dialog = cls._instance
+        if dialog is None or not _window_exists(dialog):
+            dialog = cls._instance = cls(parent)
+            return dialog
+        
+        dialog.result = None
+        dialog.ip_var.set("")
+        dialog.port_var.set("27015")
+        dialog.validation_label.config(text="")
+        _reopen(dialog, parent)
+        dialog.ip_entry.focus_set()
+        return dialog
     
     def validate(self) -> bool:
         """Validate input fields."""
@@ -125,21 +154,16 @@ class AddServerDialog(tk.Toplevel):
             self.validation_label.config(text="Port must be a number")
             return False
         
-        # Basic IP validation (simplified)
-        parts = ip.split(".")
-        if len(parts) != 4:
-            self.validation_label.config(text="Invalid IP address format")
+        try:
+            addr = ipaddress.ip_address(ip)
+        except ValueError:
+            self.validation_label.config(text="Invalid IP address")
             return False
         
-        for part in parts:
-            try:
-                num = int(part)
-                if not (0 <= num <= 255):
-                    self.validation_label.config(text="Invalid IP address")
-                    return False
-            except ValueError:
-                self.validation_label.config(text="Invalid IP address")
-                return False
+        # Master server responses only carry 4-byte addresses
+        if addr.version != 4:
+            self.validation_label.config(text="Only IPv4 addresses are supported")
+            return False
         
         self.validation_label.config(text="")
         return True
@@ -150,24 +174,34 @@ class AddServerDialog(tk.Toplevel):
             ip = self.ip_var.get().strip()
             port = int(self.port_var.get().strip())
             self.result = (ip, port)
-            self.destroy()
+            self._close()
     
     def on_cancel(self):
         """Cancel button clicked."""
         self.result = None
-        self.destroy()
+        self._close()
+    
+    def _close(self):
+        """Hide the dialog so it can be reused."""
+        self.grab_release()
+        self.withdraw()
+        self._closed.set(True)
     
     def show(self) -> Optional[Tuple[str, int]]:
         """Show dialog and return result."""
-        self.wait_window()
+        self.wait_variable(self._closed)
         return self.result
 
 
 class ConfigEditorDialog(tk.Toplevel):
     """
     Dialog for editing configuration settings.
+    
+    A single hidden instance is reused between opens; use ConfigEditorDialog.get().
     """
     
+    _instance: Optional["ConfigEditorDialog"] = None
+    
     def __init__(self, parent, config_data: dict):
         super().__init__(parent)
         
@@ -181,6 +215,7 @@ class ConfigEditorDialog(tk.Toplevel):
         
         self.config_data = config_data.copy()
         self.result = None
+        self._closed = tk.BooleanVar(value=False)
         
         # Create notebook for tabs
         notebook = ttk.Notebook(self)
@@ -191,19 +226,19 @@ class ConfigEditorDialog(tk.Toplevel):
         notebook.add(network_frame, text="Network")
         
         row = 0
-        tk.Label(network_frame, text="Host:", font=(Fonts.FAMILY_DEFAULT, Fonts.SIZE_NORMAL)).grid(
+        tk.Label(network_frame, text="Host:", font=_FONT_NORMAL).grid(
             row=row, column=0, sticky=tk.W, pady=5
         )
-        self.host_var = tk.StringVar(value=config_data.get("HOST", "0.0.0.0"))
+        self.host_var = tk.StringVar()
         tk.Entry(network_frame, textvariable=self.host_var, width=30).grid(
             row=row, column=1, pady=5, padx=(10, 0), sticky=tk.W
         )
         
         row += 1
-        tk.Label(network_frame, text="Port:", font=(Fonts.FAMILY_DEFAULT, Fonts.SIZE_NORMAL)).grid(
+        tk.Label(network_frame, text="Port:", font=_FONT_NORMAL).grid(
             row=row, column=0, sticky=tk.W, pady=5
         )
-        self.port_var = tk.StringVar(value=config_data.get("PORTGS", "27010"))
+        self.port_var = tk.StringVar()
         tk.Entry(network_frame, textvariable=self.port_var, width=30).grid(
             row=row, column=1, pady=5, padx=(10, 0), sticky=tk.W
         )
@@ -213,25 +248,25 @@ class ConfigEditorDialog(tk.Toplevel):
         notebook.add(behavior_frame, text="Behavior")
         
         row = 0
-        tk.Label(behavior_frame, text="Mode:", font=(Fonts.FAMILY_DEFAULT, Fonts.SIZE_NORMAL)).grid(
+        tk.Label(behavior_frame, text="Mode:", font=_FONT_NORMAL).grid(
             row=row, column=0, sticky=tk.W, pady=5
         )
-        self.mode_var = tk.StringVar(value=config_data.get("MODE", "file"))
+        self.mode_var = tk.StringVar()
         tk.Entry(behavior_frame, textvariable=self.mode_var, width=30, state="readonly").grid(
             row=row, column=1, pady=5, padx=(10, 0), sticky=tk.W
         )
         
         row += 1
-        tk.Label(behavior_frame, text="Refresh Interval (s):", font=(Fonts.FAMILY_DEFAULT, Fonts.SIZE_NORMAL)).grid(
+        tk.Label(behavior_frame, text="Refresh Interval (s):", font=_FONT_NORMAL).grid(
             row=row, column=0, sticky=tk.W, pady=5
         )
-        self.refresh_var = tk.StringVar(value=config_data.get("REFRESH", "60"))
+        self.refresh_var = tk.StringVar()
         tk.Entry(behavior_frame, textvariable=self.refresh_var, width=30).grid(
             row=row, column=1, pady=5, padx=(10, 0), sticky=tk.W
         )
         
         row += 1
-        self.noping_var = tk.BooleanVar(value=config_data.get("NOPING", "0") == "1")
+        self.noping_var = tk.BooleanVar()
         tk.Checkbutton(
             behavior_frame,
             text="No Ping (omit trailing zero bytes)",
@@ -239,7 +274,7 @@ class ConfigEditorDialog(tk.Toplevel):
         ).grid(row=row, column=0, columnspan=2, sticky=tk.W, pady=5)
         
         row += 1
-        self.randomize_var = tk.BooleanVar(value=config_data.get("RANDOM", "0") == "1")
+        self.randomize_var = tk.BooleanVar()
         tk.Checkbutton(
             behavior_frame,
             text="Randomize server list",
@@ -251,7 +286,7 @@ class ConfigEditorDialog(tk.Toplevel):
         notebook.add(geoip_frame, text="GeoIP")
         
         row = 0
-        self.geoip_enabled_var = tk.BooleanVar(value=config_data.get("ENABLE", "1") == "1")
+        self.geoip_enabled_var = tk.BooleanVar()
         tk.Checkbutton(
             geoip_frame,
             text="Enable GeoIP lookups",
@@ -259,14 +294,14 @@ class ConfigEditorDialog(tk.Toplevel):
         ).grid(row=row, column=0, columnspan=2, sticky=tk.W, pady=5)
         
         row += 1
-        tk.Label(geoip_frame, text="Database Path:", font=(Fonts.FAMILY_DEFAULT, Fonts.SIZE_NORMAL)).grid(
+        tk.Label(geoip_frame, text="Database Path:", font=_FONT_NORMAL).grid(
             row=row, column=0, sticky=tk.W, pady=5
         )
         
         db_frame = tk.Frame(geoip_frame)
         db_frame.grid(row=row, column=1, pady=5, padx=(10, 0), sticky=tk.W)
         
-        self.db_path_var = tk.StringVar(value=config_data.get("DB_PATH", "GeoLite2-Country.mmdb"))
+        self.db_path_var = tk.StringVar()
         tk.Entry(db_frame, textvariable=self.db_path_var, width=25).pack(side=tk.LEFT)
         tk.Button(
             db_frame,
@@ -281,7 +316,7 @@ class ConfigEditorDialog(tk.Toplevel):
         notebook.add(logging_frame, text="Logging")
         
         row = 0
-        self.log_once_var = tk.BooleanVar(value=config_data.get("ONCE_PER_IP", "1") == "1")
+        self.log_once_var = tk.BooleanVar()
         tk.Checkbutton(
             logging_frame,
             text="Log each IP only once",
@@ -289,17 +324,17 @@ class ConfigEditorDialog(tk.Toplevel):
         ).grid(row=row, column=0, columnspan=2, sticky=tk.W, pady=5)
         
         row += 1
-        tk.Label(logging_frame, text="Throttle Seconds:", font=(Fonts.FAMILY_DEFAULT, Fonts.SIZE_NORMAL)).grid(
+        tk.Label(logging_frame, text="Throttle Seconds:", font=_FONT_NORMAL).grid(
             row=row, column=0, sticky=tk.W, pady=5
         )
-        self.throttle_var = tk.StringVar(value=config_data.get("THROTTLE_SECONDS", "10"))
+        self.throttle_var = tk.StringVar()
         tk.Entry(logging_frame, textvariable=self.throttle_var, width=30).grid(
             row=row, column=1, pady=5, padx=(10, 0), sticky=tk.W
         )
         tk.Label(
             logging_frame,
             text="(Used when 'Log once' is disabled)",
-            font=(Fonts.FAMILY_DEFAULT, Fonts.SIZE_SMALL),
+            font=_FONT_SMALL,
             fg=Colors.TEXT_SECONDARY
         ).grid(row=row+1, column=0, columnspan=2, sticky=tk.W, pady=0)
         
@@ -328,6 +363,36 @@ class ConfigEditorDialog(tk.Toplevel):
         
         # Bind Escape
         self.bind("<Escape>", lambda e: self.on_cancel())
+        self.protocol("WM_DELETE_WINDOW", self.on_cancel)
+        
+        self._load(config_data)
+    
+    @classmethod
+    def get(cls, parent, config_data: dict) -> "ConfigEditorDialog":
+        """Return the shared dialog loaded with config_data, creating it on first use."""
+        dialog = cls._instance
+        if dialog is None or not _window_exists(dialog):
+            dialog = cls._instance = cls(parent, config_data)
+            return dialog
+        
+        dialog.config_data = config_data.copy()
+        dialog.result = None
+        dialog._load(config_data)
+        _reopen(dialog, parent)
+        return dialog
+    
+    def _load(self, config_data: dict):
+        """Populate the form fields from config_data."""
+        self.host_var.set(config_data.get("HOST", "0.0.0.0"))
+        self.port_var.set(config_data.get("PORTGS", "27010"))
+        self.mode_var.set(config_data.get("MODE", "file"))
+        self.refresh_var.set(config_data.get("REFRESH", "60"))
+        self.noping_var.set(config_data.get("NOPING", "0") == "1")
+        self.randomize_var.set(config_data.get("RANDOM", "0") == "1")
+        self.geoip_enabled_var.set(config_data.get("ENABLE", "1") == "1")
+        self.db_path_var.set(config_data.get("DB_PATH", "GeoLite2-Country.mmdb"))
+        self.log_once_var.set(config_data.get("ONCE_PER_IP", "1") == "1")
+        self.throttle_var.set(config_data.get("THROTTLE_SECONDS", "10"))
     
     def browse_database(self):
         """Browse for GeoIP database file."""
@@ -353,16 +418,22 @@ class ConfigEditorDialog(tk.Toplevel):
             "ONCE_PER_IP": "1" if self.log_once_var.get() else "0",
             "THROTTLE_SECONDS": self.throttle_var.get(),
         }
-        self.destroy()
+        self._close()
     
     def on_cancel(self):
         """Cancel button clicked."""
         self.result = None
-        self.destroy()
+        self._close()
+    
+    def _close(self):
+        """Hide the dialog so it can be reused."""
+        self.grab_release()
+        self.withdraw()
+        self._closed.set(True)
     
     def show(self) -> Optional[dict]:
         """Show dialog and return result."""
-        self.wait_window()
+        self.wait_variable(self._closed)
         return self.result
 
 
@@ -389,7 +460,7 @@ class AboutDialog(tk.Toplevel):
         title_label = tk.Label(
             main_frame,
             text=f"{Icons.SERVER} CS 1.6 Master Server",
-            font=(Fonts.FAMILY_DEFAULT, Fonts.SIZE_HEADER, Fonts.WEIGHT_BOLD),
+            font=_FONT_HEADER,
             fg=Colors.PRIMARY
         )
         title_label.pack(pady=(0, 10))
@@ -398,7 +469,7 @@ class AboutDialog(tk.Toplevel):
         version_label = tk.Label(
             main_frame,
             text="Version 2.0 - GUI Edition",
-            font=(Fonts.FAMILY_DEFAULT, Fonts.SIZE_MEDIUM)
+            font=_FONT_MEDIUM
         )
         version_label.pack(pady=5)
         
@@ -418,7 +489,7 @@ Features:
         desc_label = tk.Label(
             main_frame,
             text=desc_text.strip(),
-            font=(Fonts.FAMILY_DEFAULT, Fonts.SIZE_NORMAL),
+            font=_FONT_NORMAL,
             justify=tk.LEFT,
             fg=Colors.TEXT_SECONDARY
         )
@@ -428,7 +499,7 @@ Features:
         credits_label = tk.Label(
             main_frame,
             text="© 2025 | Python + Tkinter",
-            font=(Fonts.FAMILY_DEFAULT, Fonts.SIZE_SMALL),
+            font=_FONT_SMALL,
             fg=Colors.TEXT_DISABLED
         )
         credits_label.pack(pady=10)
@@ -449,6 +520,22 @@ Features:
         self.bind("<Escape>", lambda e: self.destroy())
 
 
+def _window_exists(window: tk.Misc) -> bool:
+    """Return True if the Tk window has not been destroyed."""
+    try:
+        return bool(window.winfo_exists())
+    except tk.TclError:
+        return False
+
+
+def _reopen(dialog: tk.Toplevel, parent):
+    """Show a previously withdrawn pooled dialog again."""
+    dialog.transient(parent)
+    dialog.deiconify()
+    dialog.lift()
+    dialog.grab_set()
+
+
 def show_error(parent, title: str, message: str):
     """Show an error message dialog."""
     messagebox.showerror(title, message, parent=parent)
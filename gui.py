@@ -6,25 +6,27 @@ Provides a modern desktop interface with real-time monitoring and management.
 
 import tkinter as tk
 from tkinter import ttk, messagebox
+import importlib.util
+import io
 import threading
+import time
 import configparser
+from concurrent.futures import ThreadPoolExecutor
+import csv
+import json
 import os
+import queue
+import re
 import sys
 from datetime import datetime
-from typing import Optional, List, Tuple
+from typing import Optional, List, Tuple, Dict, Callable
 
 # Import and call ensure_vendor_on_path FIRST before other imports
 from ms import BASE_DIR, ensure_vendor_on_path
 ensure_vendor_on_path()  # Make vendor modules available
 
-# Try to import pystray for system tray support (optional)
-try:
-    import pystray
-    from PIL import Image, ImageDraw
-    HAS_SYSTRAY = True
-except ImportError:
-    HAS_SYSTRAY = False
-    pystray = None
+# System tray support is optional; pystray/PIL are only imported when the tray is built
+HAS_SYSTRAY = all(importlib.util.find_spec(mod) is not None for mod in ("pystray", "PIL"))
 
 # Azure theme will be loaded via Tcl - no Python import needed
 # Use simplified version that works without images
@@ -43,13 +45,113 @@ from dialogs import (
     save_file_dialog, open_file_dialog
 )
 
+# Tray icon rendered once, kept as PNG bytes for any later tray rebuild
+_TRAY_ICON_PNG: Optional[bytes] = None
+
+# Log timestamp cache: strftime runs once per wall-clock second
+_last_ts_sec = 0
+_last_ts_str = ""
+
+
+def _log_timestamp() -> str:
+    """Current time as HH:MM:SS, formatted at most once per second."""
+    global _last_ts_sec, _last_ts_str
+    sec = int(time.time())
+    if sec != _last_ts_sec:
+        _last_ts_str = time.strftime("%H:%M:%S", time.localtime(sec))
+        _last_ts_sec = sec
+    return _last_ts_str
+
+
+# ms.cfg is plain "[SECTION]" + "key = value"; anything fancier falls back to configparser
+_SECTION_RE = re.compile(r'^\[([^\]]+)\]\s*$')
+_KV_RE = re.compile(r'^\s*([^=;#\s][^=]*?)\s*=\s*(.*?)\s*$')
+
+
+def _fast_ini_read(path: str) -> Dict[str, Dict[str, str]]:
+    """Parse an INI file into {section: {key: value}}, keys lowercased like configparser."""
+    try:
+        with open(path, "r", encoding="utf-8") as f:
+            text = f.read()
+    except OSError:
+        return {}
+    
+    data = {}
+    section = None
+    for line in text.splitlines():
+        stripped = line.strip()
+        if not stripped or stripped[0] in "#;":
+            continue
+        m = _SECTION_RE.match(line)
+        if m:
+            section = data.setdefault(m.group(1), {})
+            continue
+        m = _KV_RE.match(line)
+        if m and section is not None and not line[0].isspace():
+            section[m.group(1).lower()] = m.group(2)
+            continue
+        
+        # Continuation lines, ':' delimiters, keys before any section...
+        cfg = configparser.RawConfigParser()
+        cfg.read_string(text)
+        return {name: dict(cfg.items(name)) for name in cfg.sections()}
+    
+    return data
+
+
+def _fast_ini_write(path: str, data: Dict[str, Dict[str, str]]):
+    """Write {section: {key: value}} in configparser's layout, atomically and in one write."""
+    out = []
+    for name, items in data.items():
+        out.append(f"[{name}]\n")
+        out.extend(f"{key} = {value}\n" for key, value in items.items())
+        out.append("\n")
+    payload = "".join(out).encode("utf-8")
+    
+    # Write a temp file and rename it over the original so readers never see a partial file
+    tmp = path + ".tmp"
+    fd = os.open(tmp, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o644)
+    try:
+        os.write(fd, payload)
+        os.fsync(fd)
+    finally:
+        os.close(fd)
+    os.replace(tmp, path)
+
+
+def _cfg_get(cfg: Dict[str, Dict[str, str]], section: str, key: str, fallback: str) -> str:
+    """Look up a value in a _fast_ini_read() result."""
+    return cfg.get(section, {}).get(key.lower(), fallback)
+
+
+def _cfg_set(cfg: Dict[str, Dict[str, str]], section: str, key: str, value: str):
+    """Set a value in a _fast_ini_read() result, creating the section if needed."""
+    cfg.setdefault(section, {})[key.lower()] = value
+
+
+# Config editor fields: (dialog key, ms.cfg section, default, written back on save).
+# MODE is shown read-only in the editor, so it is never saved from there.
+_CFG_SPEC = (
+    ("HOST", "OPTIONS", "0.0.0.0", True),
+    ("PORTGS", "OPTIONS", "27010", True),
+    ("MODE", "OPTIONS", "file", False),
+    ("REFRESH", "OPTIONS", "60", True),
+    ("NOPING", "OPTIONS", "0", True),
+    ("RANDOM", "FILE", "0", True),
+    ("ENABLE", "GEOIP", "1", True),
+    ("DB_PATH", "GEOIP", "GeoLite2-Country.mmdb", True),
+    ("ONCE_PER_IP", "LOG", "1", True),
+    ("THROTTLE_SECONDS", "LOG", "10", True),
+)
+
 
 class MasterServerGUI:
     """
     Main GUI application for the CS 1.6 Master Server.
     """
     
-    def __init__(self, root: tk.Tk):
+    def __init__(self, root: tk.Tk, server: Optional[MasterServer] = None,
+                 server_factory: Optional[Callable[[], MasterServer]] = None):
         self.root = root
         self.root.title("CS 1.6 Master Server - Control Panel")
         self.root.geometry(f"{Layout.WINDOW_DEFAULT_WIDTH}x{Layout.WINDOW_DEFAULT_HEIGHT}")
@@ -59,10 +161,38 @@ class MasterServerGUI:
         self.server: Optional[MasterServer] = None
         self.server_thread: Optional[threading.Thread] = None
         self.is_running = False
+        # Builds a replacement server shared with the other frontends (None: the GUI builds its own)
+        self._server_factory = server_factory
+        
+        # Shared pool for short background jobs (the server loop keeps its own thread)
+        self._pool = ThreadPoolExecutor(max_workers=4, thread_name_prefix="gui-bg")
+        
+        # Update tick state
+        self.update_job = None
+        self._tick_count = 0
+        self._visible = True
+        self._on_dashboard = True
+        self._stat_cache = {}  # card -> raw value last rendered
+        
+        # Server log lines queued from any thread, drained on the Tk thread
+        self._log_q = queue.Queue()
+        self._log_drain_job = None
+        
+        # Pending debounced filter job (search is debounced by the filter bar)
+        self._filter_after_id = None
         
-        # Update job IDs
-        self.stats_update_job = None
-        self.chart_update_job = None
+        # (timestamp, servers) from the last get_servers() call
+        self._servers_cache = None
+        # Held across every read-modify-save of the server list (Tk thread and bulk-add worker)
+        self._servers_lock = threading.Lock()
+        
+        # Last ms.cfg text shown in the Configuration tab; read on first view
+        self._last_cfg_text = None
+        self._config_loaded = False
+        
+        # Parsed ms.cfg, reused until the file's mtime changes
+        self._cfg_data = None
+        self._cfg_mtime = None
         
         # System tray
         self.tray_icon = None
@@ -74,12 +204,12 @@ class MasterServerGUI:
         self._create_control_panel()
         self._create_status_bar()
         
-        # Initialize server in stopped state
-        self._init_server()
+        # Initialize server in stopped state (or adopt one shared with another frontend)
+        self._init_server(server)
         
-        # Setup system tray if available
+        # Setup system tray if available (deferred: imports pystray/PIL)
         if HAS_SYSTRAY:
-            self._setup_system_tray()
+            self.root.after_idle(self._setup_system_tray)
         
         # Bind window close event
         self.root.protocol("WM_DELETE_WINDOW", self.on_closing)
@@ -87,6 +217,8 @@ class MasterServerGUI:
         # Apply Azure theme AFTER window is fully created
         self.current_theme_mode = "light"  # Start with light theme
         self._theme_loaded = False
+        self._applied_theme_mode = None
+        self._theme_job = None
         if HAS_AZURE_THEME:
             self.root.after(100, self._apply_azure_theme)
         
@@ -140,6 +272,7 @@ class MasterServerGUI:
         """Create the dashboard tab with modern statistics."""
         dashboard = tk.Frame(self.notebook, bg=Colors.BG_SECONDARY)
         self.notebook.add(dashboard, text=f"{Icons.STATS} Dashboard")
+        self._dashboard_tab = str(dashboard)
         
         # Top stats cards - Modern colored cards
         cards_frame = tk.Frame(dashboard, bg=Colors.BG_SECONDARY)
@@ -211,6 +344,12 @@ class MasterServerGUI:
         ModernButton(right_buttons, "Export", self.on_export_servers_menu, "secondary", "📤").pack(side=tk.LEFT, padx=2)
         ModernButton(right_buttons, "Refresh", self.on_refresh_servers, "secondary", "🔄").pack(side=tk.LEFT, padx=2)
         
+        # Export format menu, built once and popped up on demand
+        self._export_menu = tk.Menu(self.root, tearoff=0)
+        self._export_menu.add_command(label="📄 Export as TXT", command=lambda: self.on_export_servers("txt"))
+        self._export_menu.add_command(label="📊 Export as CSV", command=lambda: self.on_export_servers("csv"))
+        self._export_menu.add_command(label="💾 Export as JSON", command=lambda: self.on_export_servers("json"))
+        
         # Server table
         self.server_table = ServerTable(serverlist)
         self.server_table.pack(side=tk.TOP, fill=tk.BOTH, expand=True, padx=8, pady=(0, 8))
@@ -226,13 +365,14 @@ class MasterServerGUI:
         self.log_viewer.export_callback = self.on_export_logs
         
         # Add welcome message
-        self.log_viewer.add_log("INFO", "CS 1.6 Master Server GUI started")
-        self.log_viewer.add_log("INFO", "Click 'Start Server' to begin serving")
+        self._log("INFO", "CS 1.6 Master Server GUI started")
+        self._log("INFO", "Click 'Start Server' to begin serving")
     
     def _create_config_tab(self):
         """Create the configuration tab."""
         config = tk.Frame(self.notebook, bg=Colors.BG_PRIMARY)
         self.notebook.add(config, text=f"{Icons.SETTINGS} Configuration")
+        self._config_tab = str(config)
         
         # Info label
         info_label = tk.Label(
@@ -282,8 +422,6 @@ class MasterServerGUI:
             state=tk.DISABLED
         )
         self.config_text.pack(fill=tk.BOTH, expand=True, padx=20, pady=10)
-        
-        self._update_config_display()
     
     def _create_control_panel(self):
         """Create the control panel with start/stop button."""
@@ -363,11 +501,12 @@ class MasterServerGUI:
         )
         self.status_bar.pack(side=tk.BOTTOM, fill=tk.X)
     
-    def _init_server(self):
-        """Initialize the server instance."""
+    def _init_server(self, server: Optional[MasterServer] = None):
+        """Initialize the server instance, or attach to an existing one."""
         try:
             ensure_vendor_on_path()
-            self.server = MasterServer(gui_mode=True)
+            self.server = server if server is not None else MasterServer(gui_mode=True)
+            self._servers_cache = None
             
             # Register callbacks
             self.server.register_callback("on_log", self.on_server_log)
@@ -381,12 +520,48 @@ class MasterServerGUI:
             
         except Exception as e:
             show_error(self.root, "Initialization Error", f"Failed to initialize server:\n{e}")
-            self.log_viewer.add_log("ERROR", f"Initialization failed: {e}")
+            self._log("ERROR", f"Initialization failed: {e}")
     
     def _start_update_loops(self):
-        """Start the periodic update loops."""
-        self._update_stats()
-        self._update_charts()
+        """Start the periodic update tick."""
+        self.root.bind("<Map>", self._on_map_change, add="+")
+        self.root.bind("<Unmap>", self._on_map_change, add="+")
+        self.notebook.bind("<<NotebookTabChanged>>", self._on_tab_changed, add="+")
+        # First chart render loads matplotlib; let the window paint before that
+        self.update_job = self.root.after_idle(self._tick)
+        self._log_drain_job = self.root.after(100, self._drain_logs)
+    
+    def _on_map_change(self, event):
+        """Track whether the main window is shown (Unmap covers iconify/withdraw)."""
+        if event.widget is self.root:
+            self._visible = event.type == tk.EventType.Map
+    
+    def _on_tab_changed(self, event):
+        """Track whether the Dashboard tab is selected; load the config on first view."""
+        current = self.notebook.select()
+        self._on_dashboard = current == self._dashboard_tab
+        if self._on_dashboard:
+            # Redraw charts on the next tick rather than up to 2s later
+            self._tick_count = 0
+        elif current == self._config_tab and not self._config_loaded:
+            self._config_loaded = True
+            self._update_config_display()
+    
+    def _tick(self):
+        """1 Hz update: stat cards every tick, charts every other tick, nothing while hidden."""
+        if self._visible and self._on_dashboard:
+            self._update_stats()
+            if self._tick_count % 2 == 0:
+                self._update_charts()
+            self._tick_count += 1
+        
+        self.update_job = self.root.after(1000, self._tick)
+    
+    def _set_card(self, card: ModernStatCard, raw, fmt: str = "{:,}"):
+        """Format and set a stat card's value only if the raw value changed."""
+        if self._stat_cache.get(card) != raw:
+            self._stat_cache[card] = raw
+            card.set_value(fmt.format(raw))
     
     def _update_stats(self):
         """Update statistics display."""
@@ -394,17 +569,14 @@ class MasterServerGUI:
             stats = self.server.stats
             
             # Update stat cards
-            self.card_requests.set_value(f"{stats.total_requests:,}")
-            self.card_unique_ips.set_value(f"{stats.get_unique_ip_count():,}")
-            self.card_rps.set_value(f"{stats.get_current_rps():.2f}")
-            self.card_uptime.set_value(stats.get_uptime_formatted())
+            self._set_card(self.card_requests, stats.total_requests)
+            self._set_card(self.card_unique_ips, stats.get_unique_ip_count())
+            self._set_card(self.card_rps, round(stats.get_current_rps(), 2), "{:.2f}")
+            self._set_card(self.card_uptime, stats.get_uptime_formatted(), "{}")
             
             # Update server count
-            servers = self.server.get_servers()
-            self.card_servers.set_value(f"{len(servers):,}")
-        
-        # Schedule next update
-        self.stats_update_job = self.root.after(1000, self._update_stats)
+            servers = self._get_servers_cached()
+            self._set_card(self.card_servers, len(servers))
     
     def _update_charts(self):
         """Update chart displays."""
@@ -437,33 +609,63 @@ class MasterServerGUI:
             print(f"[ERROR] Chart update error: {e}")
             import traceback
             traceback.print_exc()
-        
-        # Schedule next update
-        self.chart_update_job = self.root.after(2000, self._update_charts)
     
     def _refresh_server_list(self):
         """Refresh the server list display."""
         if self.server:
-            servers = self.server.get_servers()
-            self.server_table.load_servers(servers)
-            # Update filter bar stats if it exists
-            if hasattr(self, 'filter_bar'):
-                self._update_filter_stats()
+            servers = self._get_servers_cached()
+            self.server_table.load_servers_chunked(
+                servers,
+                progress=lambda n, total: self.status_bar.config(text=f"Loading servers... {n:,}/{total:,}"),
+                done=self._on_server_list_loaded
+            )
+    
+    def _get_servers_cached(self) -> List[Tuple[str, int]]:
+        """Server list, memoized for 50 ms so one action or tick reads it once."""
+        now = time.monotonic()
+        if self._servers_cache is None or now - self._servers_cache[0] >= 0.05:
+            self._servers_cache = (now, self.server.get_servers())
+        # Callers mutate the list they get back
+        return list(self._servers_cache[1])
+    
+    def _save_servers(self, servers: List[Tuple[str, int]]) -> bool:
+        """Save the server list and drop the memoized copy."""
+        self._servers_cache = None
+        return self.server.save_servers(servers)
+    
+    def _on_server_list_loaded(self):
+        """Finish a chunked server list load."""
+        if self.status_bar.cget("text").startswith("Loading servers"):
+            self.status_bar.config(text="Ready")
+        # Update filter bar stats if it exists
+        if hasattr(self, 'filter_bar'):
+            self._update_filter_stats()
     
     def _update_config_display(self):
-        """Update the configuration display."""
+        """Update the configuration display (file is read off the Tk thread)."""
+        self._pool.submit(self._read_cfg_async)
+    
+    def _read_cfg_async(self):
+        """Read ms.cfg in a worker thread and hand the text back to Tk."""
         try:
             cfg_path = os.path.join(BASE_DIR, "ms.cfg")
             if os.path.exists(cfg_path):
                 with open(cfg_path, "r", encoding="utf-8") as f:
                     config_content = f.read()
-                
-                self.config_text.config(state=tk.NORMAL)
-                self.config_text.delete(1.0, tk.END)
-                self.config_text.insert(1.0, config_content)
-                self.config_text.config(state=tk.DISABLED)
+                self.root.after(0, self._apply_cfg_text, config_content)
         except Exception as e:
-            self.log_viewer.add_log("ERROR", f"Failed to read config: {e}")
+            self._log("ERROR", f"Failed to read config: {e}")
+    
+    def _apply_cfg_text(self, content: str):
+        """Show config text, skipping the Text rebuild if nothing changed."""
+        if content == self._last_cfg_text:
+            return
+        self._last_cfg_text = content
+        
+        self.config_text.config(state=tk.NORMAL)
+        self.config_text.delete(1.0, tk.END)
+        self.config_text.insert(1.0, content)
+        self.config_text.config(state=tk.DISABLED)
     
     # ==================== Server Control ====================
     
@@ -480,11 +682,13 @@ class MasterServerGUI:
             return
         
         try:
-            self.log_viewer.add_log("INFO", "Starting server...")
+            self._log("INFO", "Starting server...")
             self.status_bar.config(text="Starting server...")
             
-            # Re-initialize server to pick up config changes
-            self._init_server()
+            # Pick up config changes; rebuild only if the server can't apply them in place
+            if self.server is None or not self.server.reload_config():
+                # A shared server is replaced through its owner so every frontend sees the new one
+                self._init_server(self._server_factory() if self._server_factory else None)
             
             # Start server in separate thread
             self.server_thread = threading.Thread(target=self.server.run, daemon=True)
@@ -496,11 +700,11 @@ class MasterServerGUI:
                 bg=Colors.ERROR,
                 activebackground=Colors.ERROR_DARK
             )
-            self.log_viewer.add_log("SUCCESS", "Server started successfully")
+            self._log("SUCCESS", "Server started successfully")
             
         except Exception as e:
             show_error(self.root, "Start Error", f"Failed to start server:\n{e}")
-            self.log_viewer.add_log("ERROR", f"Failed to start server: {e}")
+            self._log("ERROR", f"Failed to start server: {e}")
             self.is_running = False
     
     def stop_server(self):
@@ -509,7 +713,7 @@ class MasterServerGUI:
             return
         
         try:
-            self.log_viewer.add_log("INFO", "Stopping server...")
+            self._log("INFO", "Stopping server...")
             self.status_bar.config(text="Stopping server...")
             
             if self.server:
@@ -521,19 +725,39 @@ class MasterServerGUI:
                 bg=Colors.SUCCESS,
                 activebackground=Colors.SUCCESS_DARK
             )
-            self.log_viewer.add_log("SUCCESS", "Server stopped")
+            self._log("SUCCESS", "Server stopped")
             self.status_bar.config(text="Server stopped")
             
         except Exception as e:
             show_error(self.root, "Stop Error", f"Failed to stop server:\n{e}")
-            self.log_viewer.add_log("ERROR", f"Failed to stop server: {e}")
+            self._log("ERROR", f"Failed to stop server: {e}")
     
     # ==================== Callbacks ====================
     
     def on_server_log(self, level: str, message: str):
-        """Handle server log messages."""
-        timestamp = datetime.now().strftime("%H:%M:%S")
-        self.log_viewer.add_log(level, message, timestamp)
+        """Handle server log messages (may be called from the server thread)."""
+        self._log_q.put((level, message, _log_timestamp()))
+    
+    def _log(self, level: str, message: str):
+        """Queue a GUI log line; it reaches the viewer with the next batched drain."""
+        self._log_q.put((level, message, None))
+    
+    def _drain_logs(self):
+        """Move up to 200 queued log lines into the viewer in one insert."""
+        self._flush_logs(200)
+        self._log_drain_job = self.root.after(100, self._drain_logs)
+    
+    def _flush_logs(self, limit: Optional[int] = None):
+        """Hand queued log lines (all of them, or up to limit) to the viewer."""
+        entries = []
+        try:
+            while limit is None or len(entries) < limit:
+                entries.append(self._log_q.get_nowait())
+        except queue.Empty:
+            pass
+        
+        if entries:
+            self.log_viewer.add_logs_bulk(entries)
     
     def on_server_request(self, ip: str, country: str):
         """Handle server request event."""
@@ -546,7 +770,7 @@ class MasterServerGUI:
     
     def on_server_error(self, error_type: str, message: str):
         """Handle server error event."""
-        self.log_viewer.add_log("ERROR", f"[{error_type}] {message}")
+        self._log("ERROR", f"[{error_type}] {message}")
     
     def on_server_status_change(self, status: str):
         """Handle server status change."""
@@ -557,21 +781,26 @@ class MasterServerGUI:
     
     def on_add_server(self):
         """Add a single new server."""
-        dialog = AddServerDialog(self.root)
-        result = dialog.show()
+        result = AddServerDialog.get(self.root).show()
         
         if result:
             ip, port = result
-            servers = self.server.get_servers()
+            with self._servers_lock:
+                # Fresh read: a bulk add may have saved since the cache was filled
+                servers = self.server.get_servers()
+                
+                # Check for duplicates
+                duplicate = (ip, port) in servers
+                if not duplicate:
+                    servers.append((ip, port))
+                    saved = self._save_servers(servers)
             
-            # Check for duplicates
-            if (ip, port) in servers:
+            if duplicate:
                 show_warning(self.root, "Duplicate Server", f"Server {ip}:{port} already exists")
                 return
             
-            servers.append((ip, port))
-            if self.server.save_servers(servers):
-                self.log_viewer.add_log("SUCCESS", f"Added server {ip}:{port}")
+            if saved:
+                self._log("SUCCESS", f"Added server {ip}:{port}")
                 self._refresh_server_list()
                 if self.is_running:
                     self.server.load_servers()
@@ -582,27 +811,55 @@ class MasterServerGUI:
             dialog = ServerDiscoveryDialog(self.root, self.bulk_add_servers)
         except Exception as e:
             show_error(self.root, "Discovery Error", f"Could not open server discovery:\n{e}")
-            self.log_viewer.add_log("ERROR", f"Server discovery error: {e}")
+            self._log("ERROR", f"Server discovery error: {e}")
     
     def bulk_add_servers(self, new_servers: List[Tuple[str, int]]):
         """Bulk add servers from discovery dialog."""
         if not new_servers:
             return
         
-        servers = self.server.get_servers()
-        added = 0
-        skipped = 0
-        
-        for ip, port in new_servers:
-            if (ip, port) not in servers:
-                servers.append((ip, port))
-                added += 1
-            else:
-                skipped += 1
-        
+        self.status_bar.config(text=f"Adding {len(new_servers)} servers...")
+        self._pool.submit(self._bulk_add_worker, list(new_servers))
+    
+    def _bulk_add_worker(self, new_servers: List[Tuple[str, int]]):
+        """Merge and save discovered servers (runs in thread)."""
+        try:
+            # Concurrent adds and Tk-thread edits each merge into the latest saved list
+            with self._servers_lock:
+                servers = self.server.get_servers()
+                existing = set(servers)
+                added = 0
+                skipped = 0
+                
+                for server in new_servers:
+                    if server not in existing:
+                        existing.add(server)
+                        servers.append(server)
+                        added += 1
+                    else:
+                        skipped += 1
+                
+                # Not _save_servers: the memo is only touched on the Tk thread
+                saved = added > 0 and self.server.save_servers(servers)
+        except Exception as e:
+            self.root.after(0, self._bulk_add_failed, e)
+            return
+        self.root.after(0, self._bulk_add_done, added, skipped, saved)
+    
+    def _bulk_add_failed(self, error: Exception):
+        """Report a bulk add that raised (runs in main thread)."""
+        self._servers_cache = None
+        self.status_bar.config(text="Ready")
+        self._log("ERROR", f"Bulk add failed: {error}")
+        show_error(self.root, "Add Servers Error", f"Failed to add servers:\n{error}")
+    
+    def _bulk_add_done(self, added: int, skipped: int, saved: bool):
+        """Report a finished bulk add (runs in main thread)."""
+        self._servers_cache = None
+        self.status_bar.config(text="Ready")
         if added > 0:
-            if self.server.save_servers(servers):
-                self.log_viewer.add_log("SUCCESS", f"Bulk added {added} servers (skipped {skipped} duplicates)")
+            if saved:
+                self._log("SUCCESS", f"Bulk added {added} servers (skipped {skipped} duplicates)")
                 self._refresh_server_list()
                 if self.is_running:
                     self.server.load_servers()
@@ -628,13 +885,14 @@ class MasterServerGUI:
         if not show_question(self.root, "Confirm Remove", f"Remove {count} server(s)?"):
             return
         
-        servers = self.server.get_servers()
-        for server in selected:
-            if server in servers:
-                servers.remove(server)
+        # Order-preserving filter against a set instead of list.remove per server
+        drop = set(selected)
+        with self._servers_lock:
+            servers = [server for server in self.server.get_servers() if server not in drop]
+            saved = self._save_servers(servers)
         
-        if self.server.save_servers(servers):
-            self.log_viewer.add_log("SUCCESS", f"Removed {count} server(s)")
+        if saved:
+            self._log("SUCCESS", f"Removed {count} server(s)")
             self._refresh_server_list()
             if self.is_running:
                 self.server.load_servers()
@@ -644,7 +902,7 @@ class MasterServerGUI:
         if self.server:
             self.server.load_servers()
             self._refresh_server_list()
-            self.log_viewer.add_log("INFO", "Server list refreshed")
+            self._log("INFO", "Server list refreshed")
     
     def on_import_servers(self):
         """Import servers from file."""
@@ -653,44 +911,58 @@ class MasterServerGUI:
             return
         
         try:
+            parsed_servers = []
+            seen = set()
+            found = 0
+            
+            # Parse and dedup while reading; no intermediate line list
             with open(filename, "r", encoding="utf-8") as f:
-                lines = f.readlines()
+                for line in f:
+                    # Fast path for plain "ip:port"; anything else goes through the full parser
+                    host, sep, port = line.strip().partition(":")
+                    # Padding around the ':' is left to the full parser, which strips it
+                    if (sep and host and host[0] != "#" and host[-1] not in " \t"
+                            and port.isdecimal() and 0 < int(port) < 65536):
+                        parsed = (host, int(port))
+                    else:
+                        parsed = self.server._parse_server_line(line)
+                    if parsed:
+                        found += 1
+                        if parsed not in seen:
+                            seen.add(parsed)
+                            parsed_servers.append(parsed)
             
-            imported = []
-            for line in lines:
-                parsed = self.server._parse_server_line(line)
-                if parsed:
-                    imported.append(parsed)
+            new = []
+            saved = False
+            if found:
+                with self._servers_lock:
+                    servers = self.server.get_servers()
+                    existing = set(servers)
+                    new = [server for server in parsed_servers if server not in existing]
+                    if new:
+                        servers.extend(new)
+                        saved = self._save_servers(servers)
             
-            if imported:
-                servers = self.server.get_servers()
-                servers.extend(imported)
-                # Remove duplicates
-                servers = list(set(servers))
-                
-                if self.server.save_servers(servers):
-                    self.log_viewer.add_log("SUCCESS", f"Imported {len(imported)} server(s)")
-                    self._refresh_server_list()
-                    if self.is_running:
-                        self.server.load_servers()
-            else:
+            if not found:
                 show_warning(self.root, "Import Failed", "No valid servers found in file")
+            elif not new:
+                self._log("INFO", f"All {found} imported server(s) already exist")
+            elif saved:
+                self._log("SUCCESS", f"Imported {len(new)} server(s)")
+                self._refresh_server_list()
+                if self.is_running:
+                    self.server.load_servers()
                 
         except Exception as e:
             show_error(self.root, "Import Error", f"Failed to import servers:\n{e}")
     
     def on_export_servers_menu(self):
         """Show export menu with format options."""
-        menu = tk.Menu(self.root, tearoff=0)
-        menu.add_command(label="📄 Export as TXT", command=lambda: self.on_export_servers("txt"))
-        menu.add_command(label="📊 Export as CSV", command=lambda: self.on_export_servers("csv"))
-        menu.add_command(label="💾 Export as JSON", command=lambda: self.on_export_servers("json"))
-        
         # Show menu at mouse position
         try:
-            menu.tk_popup(self.root.winfo_pointerx(), self.root.winfo_pointery())
+            self._export_menu.tk_popup(self.root.winfo_pointerx(), self.root.winfo_pointery())
         finally:
-            menu.grab_release()
+            self._export_menu.grab_release()
     
     def on_export_servers(self, format_type="txt"):
         """Export servers to file in various formats."""
@@ -705,30 +977,29 @@ class MasterServerGUI:
             return
         
         try:
-            servers = self.server.get_servers()
+            servers = self._get_servers_cached()
             
             if format_type == "txt":
+                body = "".join(f"{ip}:{port}\n" for ip, port in servers)
                 with open(filename, "w", encoding="utf-8") as f:
-                    f.write("# CS 1.6 Server List\n")
-                    f.write("# Exported from Master Server GUI\n\n")
-                    for ip, port in servers:
-                        f.write(f"{ip}:{port}\n")
+                    f.write("# CS 1.6 Server List\n# Exported from Master Server GUI\n\n" + body)
             
             elif format_type == "csv":
-                import csv
                 with open(filename, "w", newline="", encoding="utf-8") as f:
                     writer = csv.writer(f)
                     writer.writerow(["IP", "Port"])
-                    for ip, port in servers:
-                        writer.writerow([ip, port])
+                    writer.writerows(servers)
             
             elif format_type == "json":
-                import json
-                data = [{"ip": ip, "port": port} for ip, port in servers]
+                # Compact, streamed from the tuples without an intermediate list of dicts
+                body = ",".join(
+                    json.dumps({"ip": ip, "port": port}, separators=(",", ":"))
+                    for ip, port in servers
+                )
                 with open(filename, "w", encoding="utf-8") as f:
-                    json.dump(data, f, indent=2)
+                    f.write("[" + body + "]")
             
-            self.log_viewer.add_log("SUCCESS", f"Exported {len(servers)} server(s) to {filename}")
+            self._log("SUCCESS", f"Exported {len(servers)} server(s) to {filename}")
             show_info(self.root, "Export Success", f"Exported {len(servers)} servers as {format_type.upper()}")
             
         except Exception as e:
@@ -736,7 +1007,7 @@ class MasterServerGUI:
     
     def on_test_servers(self):
         """Test server connectivity."""
-        servers = self.server.get_servers()
+        servers = self._get_servers_cached()
         if not servers:
             show_warning(self.root, "No Servers", "No servers to test. Please add some servers first.")
             return
@@ -746,16 +1017,23 @@ class MasterServerGUI:
             dialog = ServerTestDialog(self.root, servers)
         except Exception as e:
             show_error(self.root, "Test Error", f"Could not start server test:\n{e}")
-            self.log_viewer.add_log("ERROR", f"Server test error: {e}")
+            self._log("ERROR", f"Server test error: {e}")
     
     def _on_server_search(self, search_term: str):
-        """Handle server search."""
+        """Handle server search (already debounced by the filter bar)."""
         # This will be handled by the server table's filter
         self.server_table.filter_var.set(search_term)
         self._update_filter_stats()
     
     def _on_server_filter(self, filter_key: str):
-        """Handle server filter change."""
+        """Handle server filter change (debounced like search)."""
+        if self._filter_after_id is not None:
+            self.root.after_cancel(self._filter_after_id)
+        self._filter_after_id = self.root.after(150, lambda: self._do_filter(filter_key))
+    
+    def _do_filter(self, filter_key: str):
+        """Apply a filter change."""
+        self._filter_after_id = None
         # Filter servers based on enabled/disabled/all
         # This functionality would need database support to track enabled/disabled state
         self._update_filter_stats()
@@ -763,9 +1041,9 @@ class MasterServerGUI:
     def _update_filter_stats(self):
         """Update filter bar statistics."""
         if hasattr(self, 'filter_bar') and hasattr(self, 'server_table'):
-            total = len(self.server.get_servers())
-            # Count visible items in tree
-            visible = len(self.server_table.tree.get_children())
+            # Both counts are tracked by the table; no server reload or Tk traversal
+            total = len(self.server_table.all_servers)
+            visible = self.server_table.visible_count
             self.filter_bar.update_stats(total, visible)
     
     def on_export_logs(self, logs: List[str]):
@@ -775,11 +1053,12 @@ class MasterServerGUI:
             return
         
         try:
-            with open(filename, "w", encoding="utf-8") as f:
+            with open(filename, "w", encoding="utf-8", buffering=1 << 20) as f:
                 f.write("# CS 1.6 Master Server Logs\n")
                 f.write(f"# Exported: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}\n\n")
-                for log in logs:
-                    f.write(log + "\n")
+                if logs:
+                    f.write("\n".join(logs))
+                    f.write("\n")
             
             show_info(self.root, "Export Success", f"Exported {len(logs)} log entries")
             
@@ -788,44 +1067,39 @@ class MasterServerGUI:
     
     # ==================== Configuration ====================
     
+    def _load_cfg(self) -> Dict[str, Dict[str, str]]:
+        """Return the parsed ms.cfg, re-reading it only if the file changed."""
+        cfg_path = os.path.join(BASE_DIR, "ms.cfg")
+        try:
+            mtime = os.stat(cfg_path).st_mtime_ns
+        except OSError:
+            mtime = None
+        
+        if self._cfg_data is None or mtime != self._cfg_mtime:
+            self._cfg_data = _fast_ini_read(cfg_path)
+            self._cfg_mtime = mtime
+        return self._cfg_data
+    
     def on_edit_config(self):
         """Open configuration editor."""
         # Read current config
-        cfg = configparser.ConfigParser()
-        cfg.read(os.path.join(BASE_DIR, "ms.cfg"), encoding="utf-8")
-        
-        config_data = {
-            "HOST": cfg.get("OPTIONS", "HOST", fallback="0.0.0.0"),
-            "PORTGS": cfg.get("OPTIONS", "PORTGS", fallback="27010"),
-            "MODE": cfg.get("OPTIONS", "MODE", fallback="file"),
-            "REFRESH": cfg.get("OPTIONS", "REFRESH", fallback="60"),
-            "NOPING": cfg.get("OPTIONS", "NOPING", fallback="0"),
-            "RANDOM": cfg.get("FILE", "RANDOM", fallback="0"),
-            "ENABLE": cfg.get("GEOIP", "ENABLE", fallback="1"),
-            "DB_PATH": cfg.get("GEOIP", "DB_PATH", fallback="GeoLite2-Country.mmdb"),
-            "ONCE_PER_IP": cfg.get("LOG", "ONCE_PER_IP", fallback="1"),
-            "THROTTLE_SECONDS": cfg.get("LOG", "THROTTLE_SECONDS", fallback="10"),
-        }
+        cfg = self._load_cfg()
+        
+        config_data = {key: _cfg_get(cfg, section, key, default) for key, section, default, _ in _CFG_SPEC}
         
-        dialog = ConfigEditorDialog(self.root, config_data)
-        result = dialog.show()
+        result = ConfigEditorDialog.get(self.root, config_data).show()
         
         if result:
             # Save config
-            cfg.set("OPTIONS", "HOST", result["HOST"])
-            cfg.set("OPTIONS", "PORTGS", result["PORTGS"])
-            cfg.set("OPTIONS", "REFRESH", result["REFRESH"])
-            cfg.set("OPTIONS", "NOPING", result["NOPING"])
-            cfg.set("FILE", "RANDOM", result["RANDOM"])
-            cfg.set("GEOIP", "ENABLE", result["ENABLE"])
-            cfg.set("GEOIP", "DB_PATH", result["DB_PATH"])
-            cfg.set("LOG", "ONCE_PER_IP", result["ONCE_PER_IP"])
-            cfg.set("LOG", "THROTTLE_SECONDS", result["THROTTLE_SECONDS"])
-            
-            with open(os.path.join(BASE_DIR, "ms.cfg"), "w", encoding="utf-8") as f:
-                cfg.write(f)
-            
-            self.log_viewer.add_log("SUCCESS", "Configuration saved")
+            for key, section, _, saved in _CFG_SPEC:
+                if saved:
+                    _cfg_set(cfg, section, key, result[key])
+            
+            cfg_path = os.path.join(BASE_DIR, "ms.cfg")
+            _fast_ini_write(cfg_path, cfg)
+            self._cfg_mtime = os.stat(cfg_path).st_mtime_ns
+            
+            self._log("SUCCESS", "Configuration saved")
             self._update_config_display()
             
             if self.is_running:
@@ -855,12 +1129,13 @@ class MasterServerGUI:
             
             # Set initial theme (light)
             self.root.tk.call("set_theme", self.current_theme_mode)
+            self._applied_theme_mode = self.current_theme_mode
             
-            self.log_viewer.add_log("SUCCESS", f"Applied Azure {self.current_theme_mode} theme ✨")
+            self._log("SUCCESS", f"Applied Azure {self.current_theme_mode} theme ✨")
             print(f"[SUCCESS] Applied Azure {self.current_theme_mode} theme")
             
         except Exception as e:
-            self.log_viewer.add_log("ERROR", f"Could not apply Azure theme: {e}")
+            self._log("ERROR", f"Could not apply Azure theme: {e}")
             print(f"[ERROR] Azure theme error: {e}")
             self._theme_loaded = False
     
@@ -878,13 +1153,26 @@ class MasterServerGUI:
                 self.current_theme_mode = "light"
                 self.theme_toggle_btn.config(text="🌙 Dark Mode")
             
-            # Apply theme (just switch, don't reload)
-            self.root.tk.call("set_theme", self.current_theme_mode)
-            
-            self.log_viewer.add_log("INFO", f"Switched to {self.current_theme_mode} theme")
+            # Apply once the clicks settle; set_theme repaints every widget
+            if self._theme_job is None:
+                self._theme_job = self.root.after_idle(self._apply_theme_mode)
             
         except Exception as e:
-            self.log_viewer.add_log("ERROR", f"Could not toggle theme: {e}")
+            self._log("ERROR", f"Could not toggle theme: {e}")
+    
+    def _apply_theme_mode(self):
+        """Switch the loaded theme to current_theme_mode if it isn't already applied."""
+        self._theme_job = None
+        if self.current_theme_mode == self._applied_theme_mode:
+            return
+        
+        try:
+            # Just switch, don't reload
+            self.root.tk.call("set_theme", self.current_theme_mode)
+            self._applied_theme_mode = self.current_theme_mode
+            self._log("INFO", f"Switched to {self.current_theme_mode} theme")
+        except Exception as e:
+            self._log("ERROR", f"Could not toggle theme: {e}")
     
     # ==================== System Tray ====================
     
@@ -894,8 +1182,15 @@ class MasterServerGUI:
             return
         
         try:
+            import pystray
+            from PIL import Image, ImageDraw
+            
             # Create a simple icon
             def create_icon():
+                global _TRAY_ICON_PNG
+                if _TRAY_ICON_PNG is not None:
+                    return Image.open(io.BytesIO(_TRAY_ICON_PNG))
+                
                 width = 64
                 height = 64
                 image = Image.new('RGB', (width, height), color=(30, 136, 229))
@@ -905,6 +1200,10 @@ class MasterServerGUI:
                 dc.line([20, 25, 44, 25], fill='white', width=2)
                 dc.line([20, 35, 44, 35], fill='white', width=2)
                 dc.line([20, 45, 44, 45], fill='white', width=2)
+                
+                buf = io.BytesIO()
+                image.save(buf, 'PNG')
+                _TRAY_ICON_PNG = buf.getvalue()
                 return image
             
             # Create menu
@@ -982,11 +1281,19 @@ class MasterServerGUI:
     
     def _cleanup_and_exit(self):
         """Cleanup and exit application."""
-        # Cancel update jobs
-        if self.stats_update_job:
-            self.root.after_cancel(self.stats_update_job)
-        if self.chart_update_job:
-            self.root.after_cancel(self.chart_update_job)
+        # Cancel every pending after() job in one pass
+        pending = (
+            self.update_job, self._log_drain_job,
+            self._filter_after_id, self._theme_job,
+        )
+        for job in pending:
+            if job:
+                self.root.after_cancel(job)
+        
+        # Don't drop log lines still waiting for the next drain
+        self._flush_logs()
+        
+        self._pool.shutdown(wait=False)
         
         # Stop system tray
         if self.tray_icon:
@@ -998,10 +1305,11 @@ class MasterServerGUI:
         self.root.destroy()
 
 
-def main():
+def main(server: Optional[MasterServer] = None,
+         server_factory: Optional[Callable[[], MasterServer]] = None):
     """Main entry point for the GUI application."""
     root = tk.Tk()
-    app = MasterServerGUI(root)
+    app = MasterServerGUI(root, server, server_factory)
     root.mainloop()
 
 
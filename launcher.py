@@ -13,6 +13,25 @@ VENDOR_DIR = os.path.join(BASE_DIR, "vendor")
 if os.path.exists(VENDOR_DIR) and VENDOR_DIR not in sys.path:
     sys.path.insert(0, VENDOR_DIR)
 
+# MasterServer shared by every frontend started from this process
+_shared_server = None
+
+
+def _build_server():
+    """Create the MasterServer on first use and return the same instance afterwards."""
+    global _shared_server
+    if _shared_server is None:
+        from ms import MasterServer
+        _shared_server = MasterServer(gui_mode=True)
+    return _shared_server
+
+
+def _rebuild_server():
+    """Replace the shared MasterServer (after stop(), or a config change it can't apply in place)."""
+    global _shared_server
+    _shared_server = None
+    return _build_server()
+
 
 def show_launcher_menu():
     """Show launcher menu to choose interface mode."""
@@ -46,12 +65,13 @@ def show_launcher_menu():
     return choice if choice else "1"
 
 
-def launch_desktop_gui():
+def launch_desktop_gui(server=None):
     """Launch the Tkinter desktop GUI."""
     print("\n🎨 Launching Desktop GUI...")
     try:
         import gui
-        gui.main()
+        # A shared server must be rebuilt through _rebuild_server so it stays shared
+        gui.main(server, _rebuild_server if server is not None else None)
     except Exception as e:
         print(f"Error launching GUI: {e}")
         import traceback
@@ -64,54 +84,73 @@ def launch_web_dashboard():
     print("Starting web server...")
     
     try:
-        from ms import MasterServer
         import asyncio
+        import signal
+        import time
         from aiohttp import web
         import webbrowser
-        import threading
+        try:
+            import orjson
+            _dumps = orjson.dumps
+        except ImportError:
+            import json
+            def _dumps(obj):
+                return json.dumps(obj, separators=(',', ':')).encode('utf-8')
+        
+        def _json(obj):
+            return web.Response(body=_dumps(obj), content_type='application/json')
         
         # Create server instance
-        server = MasterServer(gui_mode=True)
+        server = _build_server()
         
-        # Start master server in background
         def run_master_server():
             try:
                 server.run()
             except Exception as e:
                 print(f"Master server error: {e}")
         
-        master_thread = threading.Thread(target=run_master_server, daemon=True)
-        master_thread.start()
-        
         # Setup web routes
+        index_path = os.path.join(BASE_DIR, 'web_ui.html')
+        static_dir = os.path.join(BASE_DIR, 'static')
+
         async def handle_index(request):
-            with open(os.path.join(BASE_DIR, 'web_ui.html'), 'r', encoding='utf-8') as f:
-                html = f.read()
-            return web.Response(text=html, content_type='text/html')
+            # FileResponse sends via sendfile() and handles ETag / If-None-Match itself
+            return web.FileResponse(index_path, headers={'Cache-Control': 'public, max-age=60'})
+        
+        # Last /api/stats body, keyed on (stats, version, second)
+        stats_cache = {'key': None, 'body': b''}
         
         async def handle_stats(request):
             stats = server.stats
             if not stats:
-                return web.json_response({})
+                return _json({})
             
-            return web.json_response({
-                'totalRequests': stats.total_requests,
-                'uniqueIPs': stats.get_unique_ip_count(),
-                'currentRPS': round(stats.get_current_rps(), 2),
-                'uptimeFormatted': stats.get_uptime_formatted(),
-                'requestRate': list(stats.get_request_rate_history()),
-                'topCountries': [{'country': c[0], 'count': c[1]} for c in stats.get_top_countries(10)]
-            })
+            # Uptime and RPS only change per second, counters only per version.
+            # version is read before the counters; Statistics bumps it after updating them.
+            key = (stats, stats.version, int(time.time()))
+            if key != stats_cache['key']:
+                stats_cache['body'] = _dumps({
+                    'totalRequests': stats.total_requests,
+                    'uniqueIPs': stats.get_unique_ip_count(),
+                    'currentRPS': round(stats.get_current_rps(), 2),
+                    'uptimeFormatted': stats.get_uptime_formatted(),
+                    'requestRate': list(stats.get_request_rate_history()),
+                    'topCountries': [{'country': c[0], 'count': c[1]} for c in stats.get_top_countries(10)]
+                })
+                stats_cache['key'] = key
+            return web.Response(body=stats_cache['body'], content_type='application/json')
         
         async def handle_servers(request):
             servers = server.get_servers()
-            return web.json_response([{'ip': ip, 'port': port} for ip, port in servers])
+            return _json([{'ip': ip, 'port': port} for ip, port in servers])
         
         # Create web app
         app = web.Application()
         app.router.add_get('/', handle_index)
         app.router.add_get('/api/stats', handle_stats)
         app.router.add_get('/api/servers', handle_servers)
+        if os.path.isdir(static_dir):
+            app.router.add_static('/static', static_dir)
         
         # Run web server
         async def start_web():
@@ -120,6 +159,10 @@ def launch_web_dashboard():
             site = web.TCPSite(runner, '127.0.0.1', 8080)
             await site.start()
             
+            loop = asyncio.get_running_loop()
+            # Master server runs on the loop's executor so shutdown can await it
+            master_future = loop.run_in_executor(None, run_master_server)
+            
             url = "http://127.0.0.1:8080"
             print(f"\n✅ Web Dashboard running at: {url}")
             print(f"🌐 Opening browser...")
@@ -128,13 +171,25 @@ def launch_web_dashboard():
             # Open browser
             webbrowser.open(url)
             
-            # Keep running
+            # Block until Ctrl+C instead of waking up every second
+            stop_evt = asyncio.Event()
+            try:
+                loop.add_signal_handler(signal.SIGINT, stop_evt.set)
+            except (NotImplementedError, RuntimeError):
+                # Windows event loops have no add_signal_handler
+                signal.signal(signal.SIGINT, lambda *_: loop.call_soon_threadsafe(stop_evt.set))
+
             try:
-                while True:
-                    await asyncio.sleep(1)
-            except KeyboardInterrupt:
+                await stop_evt.wait()
+            finally:
                 print("\n\nShutting down...")
                 await runner.cleanup()
+                await loop.run_in_executor(None, server.stop)
+                try:
+                    # serve() polls stop_event once per second
+                    await asyncio.wait_for(master_future, timeout=3)
+                except asyncio.TimeoutError:
+                    print("Master server did not stop in time")
         
         asyncio.run(start_web())
         
@@ -162,15 +217,9 @@ def launch_hybrid():
     print("Starting Desktop GUI with Web Dashboard...")
     
     try:
-        # Start web server in background
-        import threading
-        import asyncio
-        from aiohttp import web
-        from ms import MasterServer
-        
-        # This would launch both GUI and web server
-        # For now, just launch GUI
-        launch_desktop_gui()
+        # This would launch both GUI and web server on the shared server instance
+        # For now, just launch GUI (web imports stay out until the web server is wired in)
+        launch_desktop_gui(_build_server())
         
     except Exception as e:
         print(f"Error launching hybrid mode: {e}")
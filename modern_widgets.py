@@ -6,10 +6,69 @@ Includes new functionality and improved design.
 
 import tkinter as tk
 from tkinter import ttk
+import tkinter.font as tkfont
 from typing import Optional, Callable, List, Tuple
 from theme import Colors, Fonts, Layout
+import functools
 import threading
+from concurrent.futures import ThreadPoolExecutor
 import time
+import errno
+import os
+import queue
+import selectors
+import socket
+import struct
+
+
+# (interpreter, family, size, weight) -> shared named font
+_FONTS = {}
+
+
+def _font(widget, family: str, size: int, weight: str = Fonts.WEIGHT_NORMAL) -> tkfont.Font:
+    """Return a named font shared by every widget using the same spec."""
+    key = (widget.tk, family, size, weight)
+    font = _FONTS.get(key)
+    if font is None:
+        font = _FONTS[key] = tkfont.Font(root=widget, family=family, size=size, weight=weight)
+    return font
+
+
+# struct linger {on, 0 s}: close() sends RST, so probe sockets skip TIME_WAIT
+_LINGER_RST = struct.pack("hh" if os.name == "nt" else "ii", 1, 0)
+
+# connect_ex() results meaning "connect still in progress" on a non-blocking socket.
+# Winsock reports WSAEWOULDBLOCK (10035), not the C runtime's EWOULDBLOCK (140).
+_CONNECT_PENDING = frozenset((
+    0, errno.EINPROGRESS, errno.EWOULDBLOCK, errno.EALREADY,
+    getattr(errno, "WSAEWOULDBLOCK", 10035),
+    getattr(errno, "WSAEINPROGRESS", 10036),
+    getattr(errno, "WSAEALREADY", 10037),
+))
+
+
+# Option-database colors for the container widgets below, keyed on their Tk class
+# so children pick them up at creation instead of each passing bg=...
+_OPTION_DEFAULTS = (
+    ("*ModernCard.background", Colors.BG_CARD),
+    ("*ModernCard.Label.background", Colors.BG_CARD),
+    ("*ModernCard.Label.foreground", Colors.TEXT_PRIMARY),
+    ("*QuickFilterBar.background", Colors.BG_SECONDARY),
+    ("*QuickFilterBar*Frame.background", Colors.BG_SECONDARY),
+    ("*QuickFilterBar*Label.background", Colors.BG_SECONDARY),
+)
+
+# Interpreters that already have _OPTION_DEFAULTS
+_OPTIONS_APPLIED = set()
+
+
+def _apply_option_defaults(widget):
+    """Register _OPTION_DEFAULTS once per Tk interpreter."""
+    if widget.tk in _OPTIONS_APPLIED:
+        return
+    for pattern, value in _OPTION_DEFAULTS:
+        widget.option_add(pattern, value)
+    _OPTIONS_APPLIED.add(widget.tk)
 
 
 class ModernCard(tk.Frame):
@@ -17,11 +76,13 @@ class ModernCard(tk.Frame):
     Modern card widget with shadow effect and hover state.
     """
     
+    __slots__ = ()
+    
     def __init__(self, parent, title: str = "", **kwargs):
-        super().__init__(parent, **kwargs)
+        _apply_option_defaults(parent)
+        super().__init__(parent, class_="ModernCard", **kwargs)
         
         self.configure(
-            bg=Colors.BG_CARD,
             relief=tk.FLAT,
             borderwidth=0,
             padx=Layout.PADDING_MEDIUM,
@@ -35,9 +96,7 @@ class ModernCard(tk.Frame):
             title_label = tk.Label(
                 self,
                 text=title,
-                font=(Fonts.FAMILY_DEFAULT, Fonts.SIZE_MEDIUM, Fonts.WEIGHT_BOLD),
-                fg=Colors.TEXT_PRIMARY,
-                bg=Colors.BG_CARD,
+                font=_font(self, Fonts.FAMILY_DEFAULT, Fonts.SIZE_MEDIUM, Fonts.WEIGHT_BOLD),
                 anchor=tk.W
             )
             title_label.pack(side=tk.TOP, fill=tk.X, pady=(0, Layout.PADDING_SMALL))
@@ -48,6 +107,8 @@ class ModernStatCard(tk.Frame):
     Enhanced stat card with icon, gradient background, and trend indicator.
     """
     
+    __slots__ = ("color", "title_label", "value_label", "trend_label")
+    
     def __init__(self, parent, title: str, icon: str = "📊", color: str = Colors.PRIMARY, **kwargs):
         super().__init__(parent, **kwargs)
         
@@ -66,7 +127,7 @@ class ModernStatCard(tk.Frame):
         icon_label = tk.Label(
             header_frame,
             text=icon,
-            font=(Fonts.FAMILY_DEFAULT, Fonts.SIZE_XLARGE),
+            font=_font(self, Fonts.FAMILY_DEFAULT, Fonts.SIZE_XLARGE),
             bg=color,
             fg=Colors.TEXT_WHITE
         )
@@ -75,7 +136,7 @@ class ModernStatCard(tk.Frame):
         self.title_label = tk.Label(
             header_frame,
             text=title,
-            font=(Fonts.FAMILY_DEFAULT, Fonts.SIZE_SMALL),
+            font=_font(self, Fonts.FAMILY_DEFAULT, Fonts.SIZE_SMALL),
             fg=Colors.TEXT_WHITE,
             bg=color,
             anchor=tk.W
@@ -86,7 +147,7 @@ class ModernStatCard(tk.Frame):
         self.value_label = tk.Label(
             self,
             text="0",
-            font=(Fonts.FAMILY_DEFAULT, Fonts.SIZE_HEADER, Fonts.WEIGHT_BOLD),
+            font=_font(self, Fonts.FAMILY_DEFAULT, Fonts.SIZE_HEADER, Fonts.WEIGHT_BOLD),
             fg=Colors.TEXT_WHITE,
             bg=color,
             anchor=tk.W
@@ -97,7 +158,7 @@ class ModernStatCard(tk.Frame):
         self.trend_label = tk.Label(
             self,
             text="",
-            font=(Fonts.FAMILY_DEFAULT, Fonts.SIZE_TINY),
+            font=_font(self, Fonts.FAMILY_DEFAULT, Fonts.SIZE_TINY),
             fg=Colors.TEXT_WHITE,
             bg=color,
             anchor=tk.W
@@ -116,7 +177,10 @@ class ServerTestDialog(tk.Toplevel):
     Dialog for testing server connectivity.
     """
     
-    def __init__(self, parent, server_list: List[Tuple[str, int]]):
+    # Shared by every dialog so repeated test runs reuse the worker thread
+    _EXECUTOR = ThreadPoolExecutor(max_workers=2, thread_name_prefix="srvprobe")
+    
+    def __init__(self, parent, server_list: List[Tuple[str, int]], timeout: float = 1.0):
         super().__init__(parent)
         
         self.title("Test Server Connectivity")
@@ -125,14 +189,23 @@ class ServerTestDialog(tk.Toplevel):
         self.grab_set()
         
         self.server_list = server_list
-        self.results = {}
+        # Seconds before an unanswered connect counts as offline
+        self.timeout = timeout
         self.testing = False
+        # Thread handoff: the probe thread only puts rows here and schedules
+        # a flush; every widget call happens on the Tk thread. Holds without the GIL too.
+        self._pending = queue.SimpleQueue()
+        self._flush_lock = threading.Lock()
+        self._flush_scheduled = False
+        # Current probe run; _stop ends it early when the dialog closes
+        self._future = None
+        self._stop = threading.Event()
         
         # Header
         header = tk.Label(
             self,
             text="🔍 Testing Server Connectivity",
-            font=(Fonts.FAMILY_DEFAULT, Fonts.SIZE_LARGE, Fonts.WEIGHT_BOLD),
+            font=_font(self, Fonts.FAMILY_DEFAULT, Fonts.SIZE_LARGE, Fonts.WEIGHT_BOLD),
             fg=Colors.TEXT_PRIMARY,
             bg=Colors.BG_PRIMARY
         )
@@ -142,7 +215,7 @@ class ServerTestDialog(tk.Toplevel):
         self.progress_label = tk.Label(
             self,
             text="Ready to test...",
-            font=(Fonts.FAMILY_DEFAULT, Fonts.SIZE_NORMAL),
+            font=_font(self, Fonts.FAMILY_DEFAULT, Fonts.SIZE_NORMAL),
             fg=Colors.TEXT_SECONDARY
         )
         self.progress_label.pack(pady=Layout.PADDING_SMALL)
@@ -154,25 +227,9 @@ class ServerTestDialog(tk.Toplevel):
         )
         self.progress_bar.pack(fill=tk.X, padx=Layout.PADDING_LARGE, pady=Layout.PADDING_SMALL)
         
-        # Results area
-        result_frame = tk.Frame(self)
-        result_frame.pack(fill=tk.BOTH, expand=True, padx=Layout.PADDING_MEDIUM, pady=Layout.PADDING_MEDIUM)
-        
-        scrollbar = tk.Scrollbar(result_frame)
-        scrollbar.pack(side=tk.RIGHT, fill=tk.Y)
-        
-        self.result_text = tk.Text(
-            result_frame,
-            font=(Fonts.FAMILY_MONO, Fonts.SIZE_SMALL),
-            yscrollcommand=scrollbar.set,
-            wrap=tk.WORD
-        )
-        self.result_text.pack(side=tk.LEFT, fill=tk.BOTH, expand=True)
-        scrollbar.config(command=self.result_text.yview)
-        
         # Buttons
-        button_frame = tk.Frame(self)
-        button_frame.pack(pady=Layout.PADDING_MEDIUM)
+        self.button_frame = button_frame = tk.Frame(self)
+        button_frame.pack(side=tk.BOTTOM, pady=Layout.PADDING_MEDIUM)
         
         self.test_btn = tk.Button(
             button_frame,
@@ -194,58 +251,172 @@ class ServerTestDialog(tk.Toplevel):
             padx=Layout.PADDING_LARGE,
             pady=Layout.PADDING_SMALL
         ).pack(side=tk.LEFT, padx=Layout.PADDING_SMALL)
+        
+        # Results area is built once the dialog has been shown
+        self.result_tree = None
+        self._body_job = self.after_idle(self._build_body)
+    
+    def _build_body(self):
+        """Create the results area (deferred from __init__)."""
+        self._body_job = None
+        result_frame = tk.Frame(self)
+        result_frame.pack(fill=tk.BOTH, expand=True, padx=Layout.PADDING_MEDIUM,
+                          pady=Layout.PADDING_MEDIUM, before=self.button_frame)
+        
+        scrollbar = ttk.Scrollbar(result_frame, orient=tk.VERTICAL)
+        scrollbar.pack(side=tk.RIGHT, fill=tk.Y)
+        
+        self.result_tree = ttk.Treeview(
+            result_frame,
+            columns=("host", "port", "status"),
+            show="headings",
+            yscrollcommand=scrollbar.set
+        )
+        for column, heading, width, stretch in (
+            ("host", "Host", 220, True),
+            ("port", "Port", 70, False),
+            ("status", "Status", 220, True),
+        ):
+            self.result_tree.heading(column, text=heading, anchor=tk.W)
+            self.result_tree.column(column, width=width, stretch=stretch, anchor=tk.W)
+        self.result_tree.pack(side=tk.LEFT, fill=tk.BOTH, expand=True)
+        scrollbar.config(command=self.result_tree.yview)
     
     def start_test(self):
         """Start testing servers."""
         if self.testing:
             return
         
+        if self._body_job is not None:
+            # Clicked before the idle build ran
+            self.after_cancel(self._body_job)
+            self._build_body()
+        
         self.testing = True
         self.test_btn.config(state=tk.DISABLED)
-        self.result_text.delete(1.0, tk.END)
+        self.result_tree.delete(*self.result_tree.get_children())
+        self._pending = queue.SimpleQueue()
         self.progress_bar['value'] = 0
         
-        # Run test in thread
-        thread = threading.Thread(target=self._test_servers, daemon=True)
-        thread.start()
+        # Run test on the shared probe worker
+        self._future = self._EXECUTOR.submit(self._test_servers)
+    
+    def destroy(self):
+        if self._body_job is not None:
+            self.after_cancel(self._body_job)
+            self._body_job = None
+        self._stop.set()
+        if self._future is not None:
+            self._future.cancel()
+        super().destroy()
+    
+    # Sockets kept in flight at once (bounded by the process fd limit)
+    PROBE_BATCH = 256
     
     def _test_servers(self):
-        """Test each server (runs in thread)."""
-        import socket
-        
-        for i, (ip, port) in enumerate(self.server_list):
-            self.progress_label.config(text=f"Testing {ip}:{port}...")
-            
-            # Try to connect
-            result = "❌ Offline"
-            try:
-                sock = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
-                sock.settimeout(2)
-                result_code = sock.connect_ex((ip, port))
-                sock.close()
+        """Probe all servers with non-blocking connects on one selector (runs in thread)."""
+        self.after_idle(self.progress_label.config,
+                        {"text": f"Testing {len(self.server_list)} servers..."})
+        
+        pending = iter(self.server_list)
+        sel = selectors.DefaultSelector()
+        try:
+            exhausted = False
+            while not self._stop.is_set():
+                # Top up the in-flight set
+                while not exhausted and len(sel.get_map()) < self.PROBE_BATCH:
+                    entry = next(pending, None)
+                    if entry is None:
+                        exhausted = True
+                        break
+                    self._start_probe(sel, *entry)
+                
+                if not sel.get_map():
+                    break
                 
-                if result_code == 0:
-                    result = "✅ Online"
-                else:
-                    result = f"❌ Error ({result_code})"
-            except Exception as e:
-                result = f"❌ Failed ({str(e)[:20]})"
-            
-            # Update UI (must be done in main thread)
-            self.after(0, self._update_result, ip, port, result)
-            self.after(0, lambda: self.progress_bar.step(1))
-            
-            time.sleep(0.1)  # Small delay between tests
-        
-        self.after(0, self._test_complete)
+                for key, _ in sel.select(timeout=min(0.5, self.timeout)):
+                    sock = key.fileobj
+                    ip, port, _deadline = key.data
+                    err = sock.getsockopt(socket.SOL_SOCKET, socket.SO_ERROR)
+                    self._finish_probe(sel, sock, ip, port,
+                                       "✅ Online" if err == 0 else f"❌ Error ({err})")
+                
+                # Expire connects that never completed
+                now = time.monotonic()
+                for key in list(sel.get_map().values()):
+                    ip, port, deadline = key.data
+                    if now >= deadline:
+                        self._finish_probe(sel, key.fileobj, ip, port, "❌ Offline")
+        finally:
+            for key in list(sel.get_map().values()):
+                key.fileobj.close()
+            sel.close()
+        
+        if not self._stop.is_set():
+            self.after_idle(self._test_complete)
+    
+    def _start_probe(self, sel, ip, port):
+        """Open a non-blocking connect to one server and register it."""
+        try:
+            sock = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
+        except OSError as e:
+            self._update_result(ip, port, f"❌ Failed ({str(e)[:20]})")
+            return
+        try:
+            sock.setblocking(False)
+            # Probes only need the handshake; free the local port as soon as they close
+            sock.setsockopt(socket.SOL_SOCKET, socket.SO_LINGER, _LINGER_RST)
+            code = sock.connect_ex((ip, port))
+        except Exception as e:
+            sock.close()
+            self._update_result(ip, port, f"❌ Failed ({str(e)[:20]})")
+            return
+        
+        if code in _CONNECT_PENDING:
+            sel.register(sock, selectors.EVENT_WRITE,
+                         (ip, port, time.monotonic() + self.timeout))
+        else:
+            sock.close()
+            self._update_result(ip, port, f"❌ Error ({code})")
+    
+    def _finish_probe(self, sel, sock, ip, port, result):
+        """Unregister and close a probe socket, then report its result."""
+        sel.unregister(sock)
+        sock.close()
+        self._update_result(ip, port, result)
     
     def _update_result(self, ip, port, result):
-        """Update result text (runs in main thread)."""
-        self.result_text.insert(tk.END, f"{ip}:{port} - {result}\n")
-        self.result_text.see(tk.END)
+        """Queue one result row for the main thread (runs in probe thread)."""
+        if self._stop.is_set():
+            return
+        self._pending.put((ip, port, result))
+        with self._flush_lock:
+            schedule = not self._flush_scheduled
+            self._flush_scheduled = True
+        if schedule:
+            self.after_idle(self._flush_results)
+    
+    def _flush_results(self):
+        """Append all queued results as table rows (runs in main thread)."""
+        with self._flush_lock:
+            self._flush_scheduled = False
+        count = 0
+        insert = self.result_tree.insert
+        while True:
+            try:
+                row = self._pending.get_nowait()
+            except queue.Empty:
+                break
+            insert("", tk.END, values=row)
+            count += 1
+        if not count:
+            return
+        self.result_tree.yview_moveto(1.0)
+        self.progress_bar.step(count)
     
     def _test_complete(self):
         """Test complete callback."""
+        self._flush_results()
         self.progress_label.config(text="✅ Test completed!")
         self.test_btn.config(state=tk.NORMAL, text="🔄 Test Again")
         self.testing = False
@@ -256,47 +427,52 @@ class QuickFilterBar(tk.Frame):
     Quick filter bar with search and filter options.
     """
     
+    # (label, filter key, initially active)
+    FILTERS = (
+        ("All", "all", True),
+        ("Enabled", "enabled", False),
+        ("Disabled", "disabled", False),
+    )
+    
     def __init__(self, parent, **kwargs):
-        super().__init__(parent, **kwargs)
+        _apply_option_defaults(parent)
+        super().__init__(parent, class_="QuickFilterBar", **kwargs)
         
-        self.configure(bg=Colors.BG_SECONDARY, pady=Layout.PADDING_SMALL)
+        self.configure(pady=Layout.PADDING_SMALL)
         
         # Search box
-        search_frame = tk.Frame(self, bg=Colors.BG_SECONDARY)
+        search_frame = tk.Frame(self)
         search_frame.pack(side=tk.LEFT, padx=Layout.PADDING_MEDIUM)
         
         tk.Label(
             search_frame,
             text="🔍",
-            bg=Colors.BG_SECONDARY,
-            font=(Fonts.FAMILY_DEFAULT, Fonts.SIZE_NORMAL)
+            font=_font(self, Fonts.FAMILY_DEFAULT, Fonts.SIZE_NORMAL)
         ).pack(side=tk.LEFT, padx=(0, Layout.PADDING_TINY))
         
         self.search_var = tk.StringVar()
         self.search_entry = tk.Entry(
             search_frame,
             textvariable=self.search_var,
-            font=(Fonts.FAMILY_DEFAULT, Fonts.SIZE_SMALL),
+            font=_font(self, Fonts.FAMILY_DEFAULT, Fonts.SIZE_SMALL),
             width=25
         )
         self.search_entry.pack(side=tk.LEFT)
         
         # Filter buttons
-        self.filter_frame = tk.Frame(self, bg=Colors.BG_SECONDARY)
+        self.filter_frame = tk.Frame(self)
         self.filter_frame.pack(side=tk.LEFT, padx=Layout.PADDING_MEDIUM)
         
         self.filters = {}
-        self.create_filter_btn("All", "all", active=True)
-        self.create_filter_btn("Enabled", "enabled")
-        self.create_filter_btn("Disabled", "disabled")
+        for text, filter_key, active in self.FILTERS:
+            self.create_filter_btn(text, filter_key, active)
         
         # Stats label
         self.stats_label = tk.Label(
             self,
             text="0 servers",
-            font=(Fonts.FAMILY_DEFAULT, Fonts.SIZE_SMALL),
-            fg=Colors.TEXT_SECONDARY,
-            bg=Colors.BG_SECONDARY
+            font=_font(self, Fonts.FAMILY_DEFAULT, Fonts.SIZE_SMALL),
+            fg=Colors.TEXT_SECONDARY
         )
         self.stats_label.pack(side=tk.RIGHT, padx=Layout.PADDING_MEDIUM)
         
@@ -304,6 +480,9 @@ class QuickFilterBar(tk.Frame):
         self.on_search_callback: Optional[Callable] = None
         self.on_filter_callback: Optional[Callable] = None
         
+        # Pending debounced search callback
+        self._search_after_id = None
+        
         # Bind search
         self.search_var.trace("w", self._on_search)
     
@@ -312,13 +491,13 @@ class QuickFilterBar(tk.Frame):
         btn = tk.Button(
             self.filter_frame,
             text=text,
-            command=lambda: self.set_filter(filter_key),
+            command=functools.partial(self.set_filter, filter_key),
             relief=tk.FLAT,
             bg=Colors.PRIMARY if active else Colors.BG_TERTIARY,
             fg=Colors.TEXT_WHITE if active else Colors.TEXT_PRIMARY,
             padx=Layout.PADDING_MEDIUM,
             pady=Layout.PADDING_TINY,
-            font=(Fonts.FAMILY_DEFAULT, Fonts.SIZE_SMALL)
+            font=_font(self, Fonts.FAMILY_DEFAULT, Fonts.SIZE_SMALL)
         )
         btn.pack(side=tk.LEFT, padx=Layout.PADDING_TINY)
         self.filters[filter_key] = btn
@@ -328,23 +507,35 @@ class QuickFilterBar(tk.Frame):
     
     def set_filter(self, filter_key: str):
         """Set active filter."""
-        # Update button colors
-        for key, btn in self.filters.items():
-            if key == filter_key:
-                btn.config(bg=Colors.PRIMARY, fg=Colors.TEXT_WHITE)
-            else:
-                btn.config(bg=Colors.BG_TERTIARY, fg=Colors.TEXT_PRIMARY)
+        if filter_key == self.active_filter:
+            return
         
+        # Only the old and new active buttons change color
+        self.filters[self.active_filter].config(bg=Colors.BG_TERTIARY, fg=Colors.TEXT_PRIMARY)
+        self.filters[filter_key].config(bg=Colors.PRIMARY, fg=Colors.TEXT_WHITE)
         self.active_filter = filter_key
         
         if self.on_filter_callback:
             self.on_filter_callback(filter_key)
     
     def _on_search(self, *args):
-        """Search changed callback."""
+        """Search changed callback (debounced; only the last keystroke within 150 ms fires)."""
+        if self._search_after_id is not None:
+            self.after_cancel(self._search_after_id)
+        self._search_after_id = self.after(150, self._fire_search)
+    
+    def _fire_search(self):
+        """Pass the current search text to the callback."""
+        self._search_after_id = None
         if self.on_search_callback:
             self.on_search_callback(self.search_var.get())
     
+    def destroy(self):
+        if self._search_after_id is not None:
+            self.after_cancel(self._search_after_id)
+            self._search_after_id = None
+        super().destroy()
+    
     def update_stats(self, total: int, filtered: int):
         """Update stats display."""
         if total == filtered:
@@ -353,39 +544,58 @@ class QuickFilterBar(tk.Frame):
             self.stats_label.config(text=f"{filtered} of {total} servers")
 
 
-class ModernButton(tk.Button):
+# ModernButton presets: name -> (background, foreground, hover background)
+_BUTTON_STYLES = {
+    "primary": (Colors.PRIMARY, Colors.TEXT_WHITE, Colors.PRIMARY_DARK),
+    "success": (Colors.SUCCESS, Colors.TEXT_WHITE, Colors.SUCCESS_DARK),
+    "danger": (Colors.ERROR, Colors.TEXT_WHITE, Colors.ERROR_DARK),
+    "secondary": (Colors.BG_TERTIARY, Colors.TEXT_PRIMARY, Colors.BG_DARK),
+}
+
+# (interpreter, ttk theme) pairs that already have the ModernButton styles
+_STYLED_THEMES = set()
+
+
+def _ensure_button_styles(widget):
+    """Define the <Preset>.TButton styles for the current ttk theme if missing."""
+    style = ttk.Style(widget)
+    key = (widget.tk, style.theme_use())
+    if key in _STYLED_THEMES:
+        return
+    
+    font = _font(widget, Fonts.FAMILY_DEFAULT, Fonts.SIZE_NORMAL)
+    for name, (bg, fg, hover_bg) in _BUTTON_STYLES.items():
+        style_name = f"{name.capitalize()}.TButton"
+        style.configure(
+            style_name,
+            background=bg,
+            foreground=fg,
+            font=font,
+            relief=tk.FLAT,
+            padding=(Layout.PADDING_MEDIUM, Layout.PADDING_SMALL)
+        )
+        # Hover is handled by the theme engine; "!disabled" shadows TButton's own map
+        style.map(
+            style_name,
+            background=[("disabled", Colors.BG_TERTIARY), ("pressed", hover_bg),
+                        ("active", hover_bg), ("!disabled", bg)],
+            foreground=[("disabled", Colors.TEXT_DISABLED), ("!disabled", fg)]
+        )
+    _STYLED_THEMES.add(key)
+
+
+class ModernButton(ttk.Button):
     """
-    Modern styled button with hover effect.
+    Modern styled button; hover colors come from the ttk style map.
     """
     
+    __slots__ = ()
+    
     def __init__(self, parent, text: str, command: Callable = None, 
                  style: str = "primary", icon: str = "", **kwargs):
         
-        # Style presets
-        styles = {
-            "primary": {
-                "bg": Colors.PRIMARY,
-                "fg": Colors.TEXT_WHITE,
-                "hover_bg": Colors.PRIMARY_DARK
-            },
-            "success": {
-                "bg": Colors.SUCCESS,
-                "fg": Colors.TEXT_WHITE,
-                "hover_bg": Colors.SUCCESS_DARK
-            },
-            "danger": {
-                "bg": Colors.ERROR,
-                "fg": Colors.TEXT_WHITE,
-                "hover_bg": Colors.ERROR_DARK
-            },
-            "secondary": {
-                "bg": Colors.BG_TERTIARY,
-                "fg": Colors.TEXT_PRIMARY,
-                "hover_bg": Colors.BG_DARK
-            }
-        }
-        
-        style_config = styles.get(style, styles["primary"])
+        if style not in _BUTTON_STYLES:
+            style = "primary"
         
         display_text = f"{icon} {text}" if icon else text
         
@@ -393,34 +603,11 @@ class ModernButton(tk.Button):
             parent,
             text=display_text,
             command=command,
-            bg=style_config["bg"],
-            fg=style_config["fg"],
-            activebackground=style_config["hover_bg"],
-            relief=tk.FLAT,
-            font=(Fonts.FAMILY_DEFAULT, Fonts.SIZE_NORMAL),
-            padx=Layout.PADDING_MEDIUM,
-            pady=Layout.PADDING_SMALL,
+            style=f"{style.capitalize()}.TButton",
             cursor="hand2",
             **kwargs
         )
         
-        self.default_bg = style_config["bg"]
-        self.hover_bg = style_config["hover_bg"]
-        
-        # Hover effects
-        self.bind("<Enter>", self._on_enter)
-        self.bind("<Leave>", self._on_leave)
-    
-    def _on_enter(self, event):
-        """Mouse enter - show hover state."""
-        self.config(bg=self.hover_bg)
-    
-    def _on_leave(self, event):
-        """Mouse leave - restore normal state."""
-        self.config(bg=self.default_bg)
-
-
-
-
-
-
+        _ensure_button_styles(self)
+        # Styles are per ttk theme, so define them again after a theme switch
+        self.bind("<<ThemeChanged>>", lambda e: _ensure_button_styles(self), add="+")
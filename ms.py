@@ -136,6 +136,8 @@ class MasterServer:
         ensure_files()
 
         self.gui_mode = gui_mode
+        # Set once stop() has released the socket, database and GeoIP reader
+        self.is_dead = False
         self.cfg = configparser.ConfigParser()
         read = self.cfg.read(os.path.join(BASE_DIR, cfg_path), encoding="utf-8")
         if not read:
@@ -153,36 +155,7 @@ class MasterServer:
             self._log("WARNING", "Database mode requested but database module not available, falling back to file mode")
             self.mode = "file"
 
-        # Read HOST/PORT and sanitize (accept legacy values and "IP:PORT")
-        raw_host = self.cfg.get("OPTIONS", "HOST", fallback="0.0.0.0").strip()
-        port_cfg = self.cfg.get("OPTIONS", "PORTGS", fallback="27010").strip()
-
-        # If user mistakenly put "IP:PORT" in HOST, split and override port
-        if ":" in raw_host:
-            host_part, port_part = raw_host.rsplit(":", 1)
-            raw_host = host_part.strip()
-            try:
-                port_cfg = str(int(port_part.strip()))
-                self._log("INFO", f"Detected HOST contained a port; using PORTGS={port_cfg}")
-            except Exception:
-                pass
-
-        # Coerce legacy/invalid host values
-        if raw_host.lower() in ("", "off", "none", "disabled"):
-            raw_host = "0.0.0.0"
-
-        self.host = raw_host
-        try:
-            self.port = int(port_cfg)
-        except Exception:
-            self.port = 27010
-
-        self.refresh = self.cfg.getint("OPTIONS", "REFRESH", fallback=60)
-        self.noping = self.cfg.get("OPTIONS", "NOPING", fallback="0").strip() == "1"
-
-        # File mode settings
-        self.file_cs = self.cfg.get("FILE", "FILECS", fallback="servers_cs.txt").strip()
-        self.randomize = self.cfg.get("FILE", "RANDOM", fallback="0").strip() == "1"
+        self._apply_settings()
         
         # Database mode settings
         self.db_path = self.cfg.get("DATABASE", "DB_PATH", fallback="servers.db").strip()
@@ -202,10 +175,6 @@ class MasterServer:
         self.geoip_enabled = self.cfg.get("GEOIP", "ENABLE", fallback="1").strip() == "1"
         self.geoip_db_path = self.cfg.get("GEOIP", "DB_PATH", fallback="GeoLite2-Country.mmdb").strip()
 
-        # Log settings
-        self.log_once_per_ip = self.cfg.get("LOG", "ONCE_PER_IP", fallback="1").strip() == "1"
-        self.log_throttle_seconds = int(self.cfg.get("LOG", "THROTTLE_SECONDS", fallback="10").strip())
-
         # Tracking for logging
         self._logged_ips = set()   # used when ONCE_PER_IP=1
         self._log_recent = {}      # ip -> last log monotonic time, used when ONCE_PER_IP=0
@@ -249,6 +218,67 @@ class MasterServer:
         else:
             self._log("INFO", f"Log mode: throttle {self.log_throttle_seconds}s per IP")
 
+    def _apply_settings(self):
+        """Read the settings that can change without rebuilding the server."""
+        # Read HOST/PORT and sanitize (accept legacy values and "IP:PORT")
+        raw_host = self.cfg.get("OPTIONS", "HOST", fallback="0.0.0.0").strip()
+        port_cfg = self.cfg.get("OPTIONS", "PORTGS", fallback="27010").strip()
+
+        # If user mistakenly put "IP:PORT" in HOST, split and override port
+        if ":" in raw_host:
+            host_part, port_part = raw_host.rsplit(":", 1)
+            raw_host = host_part.strip()
+            try:
+                port_cfg = str(int(port_part.strip()))
+                self._log("INFO", f"Detected HOST contained a port; using PORTGS={port_cfg}")
+            except Exception:
+                pass
+
+        # Coerce legacy/invalid host values
+        if raw_host.lower() in ("", "off", "none", "disabled"):
+            raw_host = "0.0.0.0"
+
+        self.host = raw_host
+        try:
+            self.port = int(port_cfg)
+        except Exception:
+            self.port = 27010
+
+        self.refresh = self.cfg.getint("OPTIONS", "REFRESH", fallback=60)
+        self.noping = self.cfg.get("OPTIONS", "NOPING", fallback="0").strip() == "1"
+
+        # File mode settings
+        self.file_cs = self.cfg.get("FILE", "FILECS", fallback="servers_cs.txt").strip()
+        self.randomize = self.cfg.get("FILE", "RANDOM", fallback="0").strip() == "1"
+
+        # Log settings
+        self.log_once_per_ip = self.cfg.get("LOG", "ONCE_PER_IP", fallback="1").strip() == "1"
+        self.log_throttle_seconds = int(self.cfg.get("LOG", "THROTTLE_SECONDS", fallback="10").strip())
+
+    def reload_config(self, cfg_path="ms.cfg") -> bool:
+        """
+        Re-read the config into this instance.
+        Returns False if the server must be rebuilt instead (stopped, or mode/list source/GeoIP changed).
+        """
+        if self.is_dead:
+            return False
+
+        cfg = configparser.ConfigParser()
+        if not cfg.read(os.path.join(BASE_DIR, cfg_path), encoding="utf-8"):
+            return False
+
+        structural = (
+            ("OPTIONS", "MODE"), ("FILE", "FILECS"), ("DATABASE", "DB_PATH"),
+            ("GEOIP", "ENABLE"), ("GEOIP", "DB_PATH"),
+        )
+        for section, key in structural:
+            if cfg.get(section, key, fallback=None) != self.cfg.get(section, key, fallback=None):
+                return False
+
+        self.cfg = cfg
+        self._apply_settings()
+        return True
+
     # ----------------- Callback system -----------------
 
     def register_callback(self, event: str, callback: Callable):
@@ -760,6 +790,7 @@ class MasterServer:
             except Exception:
                 pass
         
+        self.is_dead = True
         self._trigger_callback("on_status_change", "stopped")
 
 
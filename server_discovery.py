@@ -7,16 +7,56 @@ Allows finding and adding multiple servers from various sources.
 import tkinter as tk
 from tkinter import ttk, scrolledtext
 from typing import List, Tuple, Optional, Callable
-import threading
+import asyncio
+import ipaddress
+import os
+from concurrent.futures import ThreadPoolExecutor
 import re
+import socket
+import struct
+import threading
 from theme import Colors, Fonts, Layout
 
 
+# IP:PORT or domain:PORT plus the candidate server name after it, in one pass
+_SERVER_RE = re.compile(
+    r'(?P<ip>\d{1,3}(?:\.\d{1,3}){3}|[a-zA-Z0-9][-a-zA-Z0-9.]+\.[a-zA-Z]{2,})'
+    r':(?P<port>\d{1,5})(?!\d)'
+    r'(?=(?:[ \t]*(?P<tail>[^\n\r<>]{1,100}))?)'  # lookahead: a name may hold the next address
+)
+# HTML brackets to drop from a name
+_HTML_STRIP_RE = re.compile(r'[<>]')
+
+
+# struct linger {on, 0 s}: closing a scan probe sends RST and skips TIME_WAIT
+_LINGER_RST = struct.pack("hh" if os.name == "nt" else "ii", 1, 0)
+
+# Widget fonts and flat button options, built once instead of per widget
+_FONT_TITLE = (Fonts.FAMILY_DEFAULT, Fonts.SIZE_LARGE, Fonts.WEIGHT_BOLD)
+_FONT_BOLD = (Fonts.FAMILY_DEFAULT, Fonts.SIZE_NORMAL, Fonts.WEIGHT_BOLD)
+_FONT_NORMAL = (Fonts.FAMILY_DEFAULT, Fonts.SIZE_NORMAL)
+_FONT_SMALL = (Fonts.FAMILY_DEFAULT, Fonts.SIZE_SMALL)
+_FONT_MONO = (Fonts.FAMILY_MONO, Fonts.SIZE_NORMAL)
+_FONT_MONO_SMALL = (Fonts.FAMILY_MONO, Fonts.SIZE_SMALL)
+_BTN_KW = dict(relief=tk.FLAT, padx=15, pady=8)
+
+
+def _host_sort_key(host: str) -> Tuple[int, str]:
+    """Sort key for a host: IPv4 addresses numerically, domains after them by name."""
+    try:
+        return struct.unpack('>I', socket.inet_aton(host))[0], ''
+    except OSError:
+        return 1 << 32, host
+
+
 class ServerDiscoveryDialog(tk.Toplevel):
     """
     Dialog for discovering and bulk-adding CS 1.6 servers.
     """
     
+    # Background work (range scans, text parsing) shares these workers across dialogs
+    _EXECUTOR = ThreadPoolExecutor(max_workers=2, thread_name_prefix="discovery")
+    
     def __init__(self, parent, add_callback: Callable):
         super().__init__(parent)
         
@@ -29,6 +69,10 @@ class ServerDiscoveryDialog(tk.Toplevel):
         
         self.add_callback = add_callback
         self.discovered_servers = []
+        self._seen_keys = set()  # (ip, port) of every row in server_tree
+        self._insert_job = None  # Pending after_idle job of a chunked insert
+        self._pending_rows = []  # Rows waiting for that job
+        self._stop = threading.Event()  # Set on close; ends background scans/parses early
         self.is_searching = False
         
         # Create UI
@@ -44,7 +88,7 @@ class ServerDiscoveryDialog(tk.Toplevel):
         tk.Label(
             header,
             text="🌐 Discover CS 1.6 Servers",
-            font=(Fonts.FAMILY_DEFAULT, Fonts.SIZE_LARGE, Fonts.WEIGHT_BOLD),
+            font=_FONT_TITLE,
             fg=Colors.TEXT_WHITE,
             bg=Colors.PRIMARY
         ).pack(side=tk.LEFT, padx=Layout.PADDING_LARGE, pady=Layout.PADDING_MEDIUM)
@@ -60,7 +104,7 @@ class ServerDiscoveryDialog(tk.Toplevel):
         tk.Label(
             method_frame,
             text="Choose Discovery Method:",
-            font=(Fonts.FAMILY_DEFAULT, Fonts.SIZE_NORMAL, Fonts.WEIGHT_BOLD),
+            font=_FONT_BOLD,
             bg=Colors.BG_SECONDARY
         ).pack(side=tk.TOP, anchor=tk.W, padx=10, pady=5)
         
@@ -68,14 +112,18 @@ class ServerDiscoveryDialog(tk.Toplevel):
         self.method_notebook = ttk.Notebook(method_frame)
         self.method_notebook.pack(fill=tk.BOTH, expand=True, padx=10, pady=10)
         
-        # Tab 1: Paste server list
-        self._create_paste_tab()
-        
-        # Tab 2: GameTracker search
-        self._create_gametracker_tab()
-        
-        # Tab 3: IP Range scan
-        self._create_scan_tab()
+        # Tabs start empty and are filled on first selection; only the first is visible at open
+        self._tab_builders = {}
+        for text, builder in (
+            ("📋 Paste List", self._create_paste_tab),
+            ("🌐 GameTracker", self._create_gametracker_tab),
+            ("🔍 IP Scan", self._create_scan_tab),
+        ):
+            frame = tk.Frame(self.method_notebook, bg=Colors.BG_PRIMARY)
+            self.method_notebook.add(frame, text=text)
+            self._tab_builders[str(frame)] = (builder, frame)
+        self.method_notebook.bind('<<NotebookTabChanged>>', self._on_tab_changed)
+        self._on_tab_changed()
         
         # Results section
         results_frame = tk.Frame(content, bg=Colors.BG_SECONDARY, relief=tk.RAISED, borderwidth=1)
@@ -84,7 +132,7 @@ class ServerDiscoveryDialog(tk.Toplevel):
         tk.Label(
             results_frame,
             text="Discovered Servers:",
-            font=(Fonts.FAMILY_DEFAULT, Fonts.SIZE_NORMAL, Fonts.WEIGHT_BOLD),
+            font=_FONT_BOLD,
             bg=Colors.BG_SECONDARY
         ).pack(side=tk.TOP, anchor=tk.W, padx=10, pady=5)
         
@@ -119,7 +167,7 @@ class ServerDiscoveryDialog(tk.Toplevel):
         self.status_label = tk.Label(
             results_frame,
             text="0 servers found",
-            font=(Fonts.FAMILY_DEFAULT, Fonts.SIZE_SMALL),
+            font=_FONT_SMALL,
             fg=Colors.TEXT_SECONDARY,
             bg=Colors.BG_SECONDARY
         )
@@ -135,10 +183,8 @@ class ServerDiscoveryDialog(tk.Toplevel):
             command=self.add_selected,
             bg=Colors.SUCCESS,
             fg=Colors.TEXT_WHITE,
-            relief=tk.FLAT,
-            font=(Fonts.FAMILY_DEFAULT, Fonts.SIZE_NORMAL),
-            padx=15,
-            pady=8
+            font=_FONT_NORMAL,
+            **_BTN_KW
         ).pack(side=tk.LEFT, padx=5)
         
         tk.Button(
@@ -147,10 +193,8 @@ class ServerDiscoveryDialog(tk.Toplevel):
             command=self.add_all,
             bg=Colors.PRIMARY,
             fg=Colors.TEXT_WHITE,
-            relief=tk.FLAT,
-            font=(Fonts.FAMILY_DEFAULT, Fonts.SIZE_NORMAL),
-            padx=15,
-            pady=8
+            font=_FONT_NORMAL,
+            **_BTN_KW
         ).pack(side=tk.LEFT, padx=5)
         
         tk.Button(
@@ -158,32 +202,32 @@ class ServerDiscoveryDialog(tk.Toplevel):
             text="🗑 Clear Results",
             command=self.clear_results,
             bg=Colors.BG_TERTIARY,
-            relief=tk.FLAT,
-            font=(Fonts.FAMILY_DEFAULT, Fonts.SIZE_NORMAL),
-            padx=15,
-            pady=8
+            font=_FONT_NORMAL,
+            **_BTN_KW
         ).pack(side=tk.LEFT, padx=5)
         
         tk.Button(
             button_frame,
             text="Close",
             command=self.destroy,
-            relief=tk.FLAT,
-            font=(Fonts.FAMILY_DEFAULT, Fonts.SIZE_NORMAL),
-            padx=15,
-            pady=8
+            font=_FONT_NORMAL,
+            **_BTN_KW
         ).pack(side=tk.RIGHT, padx=5)
     
-    def _create_paste_tab(self):
-        """Create the paste server list tab."""
-        paste_frame = tk.Frame(self.method_notebook, bg=Colors.BG_PRIMARY)
-        self.method_notebook.add(paste_frame, text="📋 Paste List")
-        
+    def _on_tab_changed(self, event=None):
+        """Build the selected tab's contents the first time it is shown."""
+        entry = self._tab_builders.pop(str(self.method_notebook.select()), None)
+        if entry:
+            builder, frame = entry
+            builder(frame)
+    
+    def _create_paste_tab(self, paste_frame: tk.Frame):
+        """Create the paste server list tab contents."""
         # Instructions
         tk.Label(
             paste_frame,
             text="Paste server list (one per line, format: IP:PORT or IP:PORT Name):",
-            font=(Fonts.FAMILY_DEFAULT, Fonts.SIZE_NORMAL),
+            font=_FONT_NORMAL,
             bg=Colors.BG_PRIMARY
         ).pack(side=tk.TOP, anchor=tk.W, padx=10, pady=10)
         
@@ -193,7 +237,7 @@ class ServerDiscoveryDialog(tk.Toplevel):
         
         self.paste_text = scrolledtext.ScrolledText(
             text_frame,
-            font=(Fonts.FAMILY_MONO, Fonts.SIZE_NORMAL),
+            font=_FONT_MONO,
             wrap=tk.WORD,
             height=10
         )
@@ -209,27 +253,23 @@ game.example.com:27016 My Server"""
         self.paste_text.insert(1.0, example)
         
         # Parse button
-        tk.Button(
+        self.paste_btn = tk.Button(
             paste_frame,
             text="🔍 Parse & Find Servers",
             command=self.parse_pasted_text,
             bg=Colors.PRIMARY,
             fg=Colors.TEXT_WHITE,
-            relief=tk.FLAT,
-            padx=15,
-            pady=8
-        ).pack(side=tk.TOP, pady=10)
+            **_BTN_KW
+        )
+        self.paste_btn.pack(side=tk.TOP, pady=10)
     
-    def _create_gametracker_tab(self):
-        """Create the GameTracker search tab."""
-        gt_frame = tk.Frame(self.method_notebook, bg=Colors.BG_PRIMARY)
-        self.method_notebook.add(gt_frame, text="🌐 GameTracker")
-        
+    def _create_gametracker_tab(self, gt_frame: tk.Frame):
+        """Create the GameTracker search tab contents."""
         # Instructions
         tk.Label(
             gt_frame,
             text="Search for CS 1.6 servers on GameTracker.com:",
-            font=(Fonts.FAMILY_DEFAULT, Fonts.SIZE_NORMAL),
+            font=_FONT_NORMAL,
             bg=Colors.BG_PRIMARY
         ).pack(side=tk.TOP, anchor=tk.W, padx=10, pady=10)
         
@@ -266,7 +306,7 @@ game.example.com:27016 My Server"""
         tk.Label(
             gt_frame,
             text=info_text,
-            font=(Fonts.FAMILY_DEFAULT, Fonts.SIZE_SMALL),
+            font=_FONT_SMALL,
             fg=Colors.TEXT_SECONDARY,
             bg=Colors.BG_PRIMARY,
             justify=tk.LEFT
@@ -284,33 +324,29 @@ game.example.com:27016 My Server"""
         
         self.gt_text = scrolledtext.ScrolledText(
             url_frame,
-            font=(Fonts.FAMILY_MONO, Fonts.SIZE_SMALL),
+            font=_FONT_MONO_SMALL,
             wrap=tk.WORD,
             height=8
         )
         self.gt_text.pack(fill=tk.BOTH, expand=True)
         
-        tk.Button(
+        self.gt_btn = tk.Button(
             gt_frame,
             text="🔍 Extract Servers from Text",
             command=self.parse_gametracker_text,
             bg=Colors.PRIMARY,
             fg=Colors.TEXT_WHITE,
-            relief=tk.FLAT,
-            padx=15,
-            pady=8
-        ).pack(side=tk.TOP, pady=10)
+            **_BTN_KW
+        )
+        self.gt_btn.pack(side=tk.TOP, pady=10)
     
-    def _create_scan_tab(self):
-        """Create the IP range scan tab."""
-        scan_frame = tk.Frame(self.method_notebook, bg=Colors.BG_PRIMARY)
-        self.method_notebook.add(scan_frame, text="🔍 IP Scan")
-        
+    def _create_scan_tab(self, scan_frame: tk.Frame):
+        """Create the IP range scan tab contents."""
         # Instructions
         tk.Label(
             scan_frame,
             text="Scan an IP range for CS 1.6 servers:",
-            font=(Fonts.FAMILY_DEFAULT, Fonts.SIZE_NORMAL),
+            font=_FONT_NORMAL,
             bg=Colors.BG_PRIMARY
         ).pack(side=tk.TOP, anchor=tk.W, padx=10, pady=10)
         
@@ -337,7 +373,7 @@ Use responsibly and only scan networks you have permission to scan."""
         tk.Label(
             scan_frame,
             text=warning_text,
-            font=(Fonts.FAMILY_DEFAULT, Fonts.SIZE_SMALL),
+            font=_FONT_SMALL,
             fg=Colors.WARNING,
             bg=Colors.BG_PRIMARY,
             justify=tk.LEFT
@@ -354,153 +390,160 @@ Use responsibly and only scan networks you have permission to scan."""
             command=self.start_scan,
             bg=Colors.PRIMARY,
             fg=Colors.TEXT_WHITE,
-            relief=tk.FLAT,
-            padx=15,
-            pady=8
+            **_BTN_KW
         )
         self.scan_btn.pack(side=tk.TOP, pady=10)
     
+    def _post(self, func, *args):
+        """Schedule func on the Tk thread from a worker, unless the dialog is closing."""
+        if self._stop.is_set():
+            return
+        try:
+            self.after(0, func, *args)
+        except (RuntimeError, tk.TclError):
+            pass  # Dialog destroyed between the check and the call
+    
     def parse_pasted_text(self):
         """Parse servers from pasted text."""
-        text = self.paste_text.get(1.0, tk.END)
-        
-        # Clear existing results first
-        self.clear_results()
-        
-        # Show processing message
-        self.status_label.config(text="Parsing servers...", fg=Colors.INFO)
-        self.update()
-        
-        servers = self._extract_servers_from_text(text, extract_names=True)
-        
-        if servers:
-            self._add_to_results(servers)
-            self.status_label.config(
-                text=f"✅ Found {len(servers)} servers in pasted text!",
-                fg=Colors.SUCCESS
-            )
-        else:
-            self.status_label.config(
-                text="❌ No valid servers found. Try format: IP:PORT",
-                fg=Colors.ERROR
-            )
+        self._start_parse(
+            self.paste_text.get(1.0, tk.END),
+            self.paste_btn,
+            "Parsing servers...",
+            "✅ Found {} servers in pasted text!",
+            "❌ No valid servers found. Try format: IP:PORT"
+        )
     
     def parse_gametracker_text(self):
         """Parse servers from GameTracker page content."""
-        text = self.gt_text.get(1.0, tk.END)
-        
+        self._start_parse(
+            self.gt_text.get(1.0, tk.END),
+            self.gt_btn,
+            "Extracting servers...",
+            "✅ Extracted {} servers from GameTracker data!",
+            "❌ No servers found. Make sure you pasted GameTracker page content."
+        )
+    
+    def _start_parse(self, text: str, button: tk.Button, busy_msg: str, found_msg: str, empty_msg: str):
+        """Extract servers from text on the executor; button stays disabled until done."""
         # Clear existing results first
         self.clear_results()
         
-        # Show processing message
-        self.status_label.config(text="Extracting servers...", fg=Colors.INFO)
-        self.update()
-        
-        servers = self._extract_servers_from_text(text, extract_names=True)
+        self.status_label.config(text=busy_msg, fg=Colors.INFO)
+        button.config(state=tk.DISABLED)
+        self._EXECUTOR.submit(self._do_parse, text, button, found_msg, empty_msg)
+    
+    def _do_parse(self, text: str, button: tk.Button, found_msg: str, empty_msg: str):
+        """Worker side of _start_parse (runs off the Tk thread)."""
+        try:
+            servers = self._extract_servers_from_text(text, extract_names=True)
+        except Exception as e:
+            print(f"Error parsing servers: {e}")
+            servers = []
+        self._post(self._parse_complete, servers, button, found_msg, empty_msg)
+    
+    def _parse_complete(self, servers: List[Tuple], button: tk.Button, found_msg: str, empty_msg: str):
+        """Show parse results (runs on the Tk thread)."""
+        if not self.winfo_exists():
+            return
+        button.config(state=tk.NORMAL)
         
         if servers:
             self._add_to_results(servers)
-            self.status_label.config(
-                text=f"✅ Extracted {len(servers)} servers from GameTracker data!",
-                fg=Colors.SUCCESS
-            )
+            self.status_label.config(text=found_msg.format(len(servers)), fg=Colors.SUCCESS)
         else:
-            self.status_label.config(
-                text="❌ No servers found. Make sure you pasted GameTracker page content.",
-                fg=Colors.ERROR
-            )
+            self.status_label.config(text=empty_msg, fg=Colors.ERROR)
     
     def _extract_servers_from_text(self, text: str, extract_names: bool = False) -> List[Tuple]:
         """Extract server IP:Port from text. Returns [(ip, port, name), ...]"""
         servers = []
         servers_dict = {}  # Use dict to avoid duplicates while preserving names
         
-        # Multiple patterns to catch various formats
-        patterns = [
-            # Pattern 1: Standard IP:PORT
-            r'(\d{1,3}\.\d{1,3}\.\d{1,3}\.\d{1,3}):(\d+)',
-            # Pattern 2: Domain:PORT
-            r'([a-zA-Z0-9][-a-zA-Z0-9.]+\.[a-zA-Z]{2,}):(\d+)',
-        ]
-        
-        # Process entire text to find all IP:PORT matches
-        for pattern in patterns:
-            for match in re.finditer(pattern, text):
-                try:
-                    ip = match.group(1)
-                    port = int(match.group(2))
-                    
-                    # Validate port range (CS 1.6 servers typically use 27000-27999)
-                    if not (1 <= port <= 65535):
-                        continue
-                    
-                    # Skip common non-server IPs
-                    if ip.startswith('127.') or ip == '0.0.0.0':
-                        continue
-                    
-                    # Extract server name if requested
-                    name = ""
-                    if extract_names:
-                        # Get surrounding context
-                        start = max(0, match.start() - 100)
-                        end = min(len(text), match.end() + 100)
-                        context = text[start:end]
-                        
-                        # Try to find server name patterns
-                        # Look for text before IP that might be a name
-                        before_match = context[:match.start() - start].strip()
-                        # Look for text after IP:PORT
-                        after_match = context[match.end() - start:].strip()
-                        
-                        # Try to extract name from after (more reliable)
-                        if after_match:
-                            # Get first line/sentence after match
-                            name_match = re.match(r'[^\n\r<>]{1,100}', after_match)
-                            if name_match:
-                                potential_name = name_match.group(0).strip()
-                                # Clean up common separators and HTML
-                                potential_name = re.sub(r'[<>]', '', potential_name)
-                                potential_name = potential_name.strip('-|/\\ \t')
-                                if potential_name and len(potential_name) > 2:
-                                    name = potential_name[:80]  # Limit length
-                    
-                    # Store server (dict prevents duplicates)
-                    key = (ip, port)
-                    if key not in servers_dict:
-                        servers_dict[key] = name
-                    elif name and not servers_dict[key]:
-                        # Update with name if we found one
-                        servers_dict[key] = name
-                        
-                except (ValueError, IndexError):
-                    continue
+        # Only lines with a ':' can hold an address; skip the rest (CSS, JS, markup) up front
+        if ':' not in text:
+            return servers
+        text = '\n'.join([line for line in text.split('\n') if ':' in line])
+        
+        # Single scan finds IP:PORT and domain:PORT matches with their names
+        for match in _SERVER_RE.finditer(text):
+            ip = match['ip']
+            port = int(match['port'])
+            
+            # Validate port range (CS 1.6 servers typically use 27000-27999)
+            if not (1 <= port <= 65535):
+                continue
+            
+            # Skip common non-server IPs
+            if ip.startswith('127.') or ip == '0.0.0.0':
+                continue
+            
+            # Repeats of a server that already has a name need no more work
+            key = (ip, port)
+            existing = servers_dict.get(key)
+            if existing:
+                continue
+            
+            # Name is the rest of the line after IP:PORT, if requested
+            name = ""
+            tail = match['tail']
+            if extract_names and tail:
+                # Clean up common separators and HTML
+                potential_name = _HTML_STRIP_RE.sub('', tail).strip('-|/\\ \t')
+                if len(potential_name) > 2:
+                    name = potential_name[:80]  # Limit length
+            
+            # Store server (dict prevents duplicates), filling in a name if we found one
+            if existing is None or name:
+                servers_dict[key] = name
         
         # Convert dict to list
         servers = [(ip, port, name) for (ip, port), name in servers_dict.items()]
         
         # Sort by IP
-        servers.sort(key=lambda x: tuple(int(p) for p in x[0].split('.')))
+        servers.sort(key=lambda x: _host_sort_key(x[0]))
         
         return servers
     
+    # Rows inserted per idle callback when adding large result sets
+    INSERT_CHUNK = 500
+    
     def _add_to_results(self, servers: List[Tuple]):
         """Add servers to the results tree."""
+        seen = self._seen_keys
+        rows = []
         for ip, port, name in servers:
-            # Check if already in results
-            exists = False
-            for item in self.server_tree.get_children():
-                values = self.server_tree.item(item)["values"]
-                if values[0] == ip and values[1] == port:
-                    exists = True
-                    break
-            
-            if not exists:
-                self.server_tree.insert("", tk.END, values=(ip, port, name))
-                self.discovered_servers.append((ip, port, name))
+            # Skip servers already in results
+            if (ip, port) in seen:
+                continue
+            seen.add((ip, port))
+            rows.append((ip, port, name))
+        # Row iid is the server's index in discovered_servers
+        base = len(self.discovered_servers)
+        items = [(str(base + i), row) for i, row in enumerate(rows)]
+        self.discovered_servers.extend(rows)
+        
+        # Small batches go in directly; large ones in idle-time chunks so the dialog keeps redrawing
+        if len(items) <= self.INSERT_CHUNK and self._insert_job is None:
+            self._insert_rows(items)
+        else:
+            self._pending_rows.extend(items)
+            if self._insert_job is None:
+                self._insert_job = self.after_idle(self._insert_chunk)
         
         # Update count
-        total = len(self.server_tree.get_children())
-        self.status_label.config(text=f"{total} servers found")
+        self.status_label.config(text=f"{len(seen)} servers found")
+    
+    def _insert_rows(self, items: List[Tuple]):
+        """Insert (iid, row) pairs into the results tree."""
+        insert = self.server_tree.insert
+        for iid, row in items:
+            insert("", tk.END, iid=iid, values=row)
+    
+    def _insert_chunk(self):
+        """Insert the next chunk of pending rows."""
+        chunk = self._pending_rows[:self.INSERT_CHUNK]
+        del self._pending_rows[:self.INSERT_CHUNK]
+        self._insert_rows(chunk)
+        self._insert_job = self.after_idle(self._insert_chunk) if self._pending_rows else None
     
     def start_scan(self):
         """Start IP range scan."""
@@ -516,56 +559,83 @@ Use responsibly and only scan networks you have permission to scan."""
             self.scan_btn.config(state=tk.DISABLED, text="⏳ Scanning...")
             self.scan_progress.start()
             
-            # Run scan in thread
-            thread = threading.Thread(
-                target=self._scan_ip_range,
-                args=(start_ip, end_ip, port),
-                daemon=True
-            )
-            thread.start()
+            # Run scan on the shared worker; destroy() sets _stop to end it early
+            self._EXECUTOR.submit(self._scan_ip_range, start_ip, end_ip, port)
             
         except ValueError:
             self.status_label.config(text="Invalid port number", fg=Colors.ERROR)
     
+    # Largest range a single scan accepts (one /16)
+    MAX_SCAN_HOSTS = 65536
+    
     def _scan_ip_range(self, start_ip: str, end_ip: str, port: int):
         """Scan IP range for servers (runs in thread)."""
-        import socket
-        
-        # Parse IP range
         try:
-            start_parts = [int(p) for p in start_ip.split('.')]
-            end_parts = [int(p) for p in end_ip.split('.')]
-        except:
-            self.after(0, lambda: self.status_label.config(text="Invalid IP range", fg=Colors.ERROR))
-            self._scan_complete()
+            self._run_scan(start_ip, end_ip, port)
+        except Exception as e:
+            print(f"Error scanning IP range: {e}")
+            msg = f"Scan failed: {e}"
+            self._post(lambda: self.status_label.config(text=msg, fg=Colors.ERROR))
+        finally:
+            # The scan button must come back however the scan ended
+            self._post(self._scan_complete)
+    
+    def _run_scan(self, start_ip: str, end_ip: str, port: int):
+        """Body of _scan_ip_range."""
+        # Parse IP range as integers so it may span more than one /24
+        try:
+            start = int(ipaddress.IPv4Address(start_ip.strip()))
+            end = int(ipaddress.IPv4Address(end_ip.strip()))
+        except ValueError:
+            self._post(lambda: self.status_label.config(text="Invalid IP range", fg=Colors.ERROR))
             return
         
-        found = []
+        if end - start >= self.MAX_SCAN_HOSTS:
+            self._post(lambda: self.status_label.config(
+                text=f"IP range too large (max {self.MAX_SCAN_HOSTS} addresses)", fg=Colors.ERROR
+            ))
+            return
         
-        # Simple scan - just check if port is open
-        # Only scan last octet for performance
-        if start_parts[:3] == end_parts[:3]:
-            base = '.'.join(str(p) for p in start_parts[:3])
-            for i in range(start_parts[3], end_parts[3] + 1):
-                ip = f"{base}.{i}"
-                
+        pack = struct.Struct('>I').pack
+        ips = [socket.inet_ntoa(pack(n)) for n in range(start, end + 1)]
+        
+        stop = self._stop
+        
+        async def probe(ip, limit):
+            async with limit:
+                # Queued probes drain at once when the dialog closes
+                if stop.is_set():
+                    return None
                 try:
-                    sock = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
-                    sock.settimeout(0.5)
-                    result = sock.connect_ex((ip, port))
-                    sock.close()
-                    
-                    if result == 0:
-                        found.append((ip, port, ""))
-                        self.after(0, lambda s=(ip, port, ""): self._add_to_results([s]))
-                except:
-                    pass
-        
-        self.after(0, lambda: self.status_label.config(
+                    _, writer = await asyncio.wait_for(asyncio.open_connection(ip, port), 0.5)
+                except (OSError, asyncio.TimeoutError):
+                    return None
+                # Only the handshake matters; free the fd and local port right away
+                sock = writer.get_extra_info('socket')
+                if sock is not None:
+                    try:
+                        sock.setsockopt(socket.SOL_SOCKET, socket.SO_LINGER, _LINGER_RST)
+                    except OSError:
+                        pass
+                writer.close()
+            server = (ip, port, "")
+            self._post(self._add_to_results, [server])
+            return server
+        
+        async def scan():
+            # Probe hosts concurrently; each batch of 256 costs about one timeout.
+            # Created here, inside the running loop: before 3.10 asyncio primitives
+            # bind to get_event_loop(), which fails in this worker thread.
+            limit = asyncio.Semaphore(256)  # keeps open sockets well under the fd limit
+            results = await asyncio.gather(*(probe(ip, limit) for ip in ips))
+            return [r for r in results if r]
+        
+        found = asyncio.run(scan()) if ips else []
+        
+        self._post(lambda: self.status_label.config(
             text=f"Scan complete: found {len(found)} servers",
             fg=Colors.SUCCESS if found else Colors.WARNING
         ))
-        self._scan_complete()
     
     def _scan_complete(self):
         """Scan complete callback."""
@@ -580,11 +650,9 @@ Use responsibly and only scan networks you have permission to scan."""
             self.status_label.config(text="No servers selected", fg=Colors.WARNING)
             return
         
-        servers_to_add = []
-        for item in selected:
-            values = self.server_tree.item(item)["values"]
-            if len(values) >= 2:
-                servers_to_add.append((values[0], int(values[1])))
+        # iids index discovered_servers, so no per-row item() lookups
+        discovered = self.discovered_servers
+        servers_to_add = [discovered[int(iid)][:2] for iid in selected]
         
         if servers_to_add and self.add_callback:
             self.add_callback(servers_to_add)
@@ -595,11 +663,7 @@ Use responsibly and only scan networks you have permission to scan."""
     
     def add_all(self):
         """Add all discovered servers."""
-        servers_to_add = []
-        for item in self.server_tree.get_children():
-            values = self.server_tree.item(item)["values"]
-            if len(values) >= 2:
-                servers_to_add.append((values[0], int(values[1])))
+        servers_to_add = [(ip, port) for ip, port, _ in self.discovered_servers]
         
         if not servers_to_add:
             self.status_label.config(text="No servers to add", fg=Colors.WARNING)
@@ -614,8 +678,18 @@ Use responsibly and only scan networks you have permission to scan."""
     
     def clear_results(self):
         """Clear all results."""
-        for item in self.server_tree.get_children():
-            self.server_tree.delete(item)
+        if self._insert_job is not None:
+            self.after_cancel(self._insert_job)
+            self._insert_job = None
+        self._pending_rows.clear()
+        self.server_tree.delete(*self.server_tree.get_children())
         self.discovered_servers.clear()
+        self._seen_keys.clear()
         self.status_label.config(text="0 servers found", fg=Colors.TEXT_SECONDARY)
-
+    
+    def destroy(self):
+        self._stop.set()
+        if self._insert_job is not None:
+            self.after_cancel(self._insert_job)
+            self._insert_job = None
+        super().destroy()
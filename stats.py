@@ -24,6 +24,9 @@ class Statistics:
         self.total_packets_sent = 0
         self.total_errors = 0
         
+        # Bumped whenever request counters change; lets readers reuse derived data
+        self.version = 0
+        
         # Unique tracking
         self.unique_ips = set()
         self.ip_first_seen = {}  # ip -> timestamp
@@ -81,6 +84,9 @@ class Statistics:
                 self._current_second_count = 1
             else:
                 self._current_second_count += 1
+            
+            # Bumped last: a reader that sees the new version also sees the new counters
+            self.version += 1
     
     def record_packets_sent(self, count: int = 1):
         """Record packets sent to a client."""
@@ -205,6 +211,7 @@ class Statistics:
             self.errors_by_type.clear()
             self.request_history.clear()
             self._history_update_time = time.time()
+            self.version += 1
     
     def export_to_dict(self) -> Dict:
         """Export statistics to a dictionary for saving/logging."""
@@ -0,0 +1,79 @@
+"""Regression checks for ServerTestDialog's non-blocking connect handling."""
+
+import os
+import sys
+import unittest
+from unittest import mock
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import modern_widgets
+from modern_widgets import ServerTestDialog
+
+
+class _FakeSocket:
+    def __init__(self, code):
+        self.code = code
+        self.closed = False
+
+    def setblocking(self, flag):
+        pass
+
+    def setsockopt(self, *args):
+        pass
+
+    def connect_ex(self, addr):
+        return self.code
+
+    def close(self):
+        self.closed = True
+
+
+class _FakeSelector:
+    def __init__(self):
+        self.registered = []
+
+    def register(self, sock, events, data):
+        self.registered.append((sock, data))
+
+
+class _Probe:
+    """Just enough of ServerTestDialog for _start_probe."""
+    timeout = 1.0
+    _start_probe = ServerTestDialog._start_probe
+
+    def __init__(self):
+        self.results = []
+
+    def _update_result(self, ip, port, result):
+        self.results.append((ip, port, result))
+
+
+class StartProbeTest(unittest.TestCase):
+    def _start(self, code):
+        probe, sel, sock = _Probe(), _FakeSelector(), _FakeSocket(code)
+        with mock.patch.object(modern_widgets.socket, "socket", return_value=sock):
+            probe._start_probe(sel, "1.2.3.4", 27015)
+        return probe, sel, sock
+
+    def test_winsock_would_block_is_in_progress(self):
+        # Windows connect_ex() on a non-blocking socket returns WSAEWOULDBLOCK
+        probe, sel, sock = self._start(10035)
+        self.assertEqual(len(sel.registered), 1)
+        self.assertEqual(probe.results, [])
+        self.assertFalse(sock.closed)
+
+    def test_posix_in_progress(self):
+        probe, sel, _ = self._start(modern_widgets.errno.EINPROGRESS)
+        self.assertEqual(len(sel.registered), 1)
+        self.assertEqual(probe.results, [])
+
+    def test_refused_is_reported(self):
+        probe, sel, sock = self._start(modern_widgets.errno.ECONNREFUSED)
+        self.assertEqual(sel.registered, [])
+        self.assertTrue(sock.closed)
+        self.assertEqual(len(probe.results), 1)
+
+
+if __name__ == "__main__":
+    unittest.main()
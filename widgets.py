@@ -166,6 +166,28 @@ class ColoredLogViewer(tk.Frame):
         if self.auto_scroll_var.get():
             self.text_widget.see(tk.END)
     
+    def add_logs_bulk(self, entries: List[Tuple[str, str, Optional[str]]]):
+        """Add many (level, message, timestamp) log messages with a single Text insert."""
+        if not entries:
+            return
+        
+        chunks = []
+        for level, message, timestamp in entries:
+            log_entry = f"[{level}] {message}"
+            if timestamp:
+                log_entry = f"{timestamp} {log_entry}"
+                chunks += (timestamp + " ", "TIMESTAMP")
+            self.log_buffer.append(log_entry)
+            chunks += (f"[{level}] ", level, message + "\n", "")
+        
+        self.text_widget.config(state=tk.NORMAL)
+        self.text_widget.insert(tk.END, *chunks)
+        self.text_widget.config(state=tk.DISABLED)
+        
+        # Auto-scroll if enabled
+        if self.auto_scroll_var.get():
+            self.text_widget.see(tk.END)
+    
     def clear_logs(self):
         """Clear all log messages."""
         self.text_widget.config(state=tk.NORMAL)
@@ -311,24 +333,74 @@ class ServerTable(tk.Frame):
         self.export_callback: Optional[Callable] = None
         
         self.all_servers = []  # Store all servers for filtering
+        self._search_keys = None  # Lowercased "ip\0port" per server, built on first filtered pass
+        self._load_job = None  # Pending after_idle job of a chunked load
+        self.visible_count = 0  # Rows currently in the tree, kept without get_children()
     
     def load_servers(self, servers: List[Tuple[str, int]]):
         """Load servers into the table."""
         self.all_servers = servers
+        self._search_keys = None
         self.refresh_display()
     
+    def load_servers_chunked(self, servers: List[Tuple[str, int]], chunk: int = 500,
+                             progress: Optional[Callable] = None, done: Optional[Callable] = None):
+        """Load servers in idle-time batches so large lists don't freeze the UI."""
+        self._cancel_load()
+        self.all_servers = servers
+        self._search_keys = None
+        self.tree.delete(*self.tree.get_children())
+        self.visible_count = 0
+        
+        rows = self._visible_servers()
+        total = len(rows)
+        
+        def insert_chunk(start):
+            end = min(start + chunk, total)
+            for ip, port in rows[start:end]:
+                self.tree.insert("", tk.END, values=(ip, port, "Active"))
+            self.visible_count = end
+            
+            if end < total:
+                if progress:
+                    progress(end, total)
+                self._load_job = self.after_idle(insert_chunk, end)
+            else:
+                self._load_job = None
+                if done:
+                    done()
+        
+        insert_chunk(0)
+    
+    def _cancel_load(self):
+        """Stop a chunked load that is still in progress."""
+        if self._load_job is not None:
+            self.after_cancel(self._load_job)
+            self._load_job = None
+    
+    def _visible_servers(self) -> List[Tuple[str, int]]:
+        """Servers matching the filter text (IP or port substring, case-insensitive)."""
+        filter_text = self.filter_var.get().lower()
+        if not filter_text:
+            return self.all_servers
+        if self._search_keys is None:
+            # Lowercased once per load instead of per server per keystroke
+            self._search_keys = [f"{ip.lower()}\0{port}" for ip, port in self.all_servers]
+        return [server for server, key in zip(self.all_servers, self._search_keys)
+                if filter_text in key]
+    
     def refresh_display(self):
         """Refresh the table display."""
+        self._cancel_load()
+        
         # Clear existing items
-        for item in self.tree.get_children():
-            self.tree.delete(item)
+        self.tree.delete(*self.tree.get_children())
         
         # Apply filter
-        filter_text = self.filter_var.get().lower()
-        for ip, port in self.all_servers:
-            if filter_text and filter_text not in ip.lower() and filter_text not in str(port):
-                continue
+        rows = self._visible_servers()
+        for ip, port in rows:
             self.tree.insert("", tk.END, values=(ip, port, "Active"))
+        self.visible_count = len(rows)
     
     def apply_filter(self):
         """Apply the current filter."""
@@ -421,6 +493,7 @@ class ChartWidget(tk.Frame):
     """
     A simple chart widget for displaying statistics.
     Falls back to text display if matplotlib is not available.
+    matplotlib is imported on the first update_data() call, not at construction.
     """
     
     def __init__(self, parent, title: str = "Chart", chart_type: str = "line", **kwargs):
@@ -430,11 +503,33 @@ class ChartWidget(tk.Frame):
         self.chart_type = chart_type
         self.data = []
         
-        # Try to use matplotlib
         self.has_matplotlib = False
+        self._matplotlib_loaded = False
         self.Figure = None
         self.FigureCanvasTkAgg = None
         
+        # Artists kept between updates and modified in place instead of redrawn
+        self._line = None
+        self._fill = None
+        self._bars = None
+        self._empty_text = None
+        self._drawn = None  # (data, labels) currently on screen
+        
+        # Placeholder until the first render decides between matplotlib and text
+        self.text_label = tk.Label(
+            self,
+            text=f"{title}\nLoading chart...",
+            font=(Fonts.FAMILY_DEFAULT, Fonts.SIZE_SMALL),
+            fg=Colors.TEXT_SECONDARY,
+            bg=Colors.BG_SECONDARY,
+            justify=tk.CENTER
+        )
+        self.text_label.pack(fill=tk.BOTH, expand=True)
+    
+    def _load_matplotlib(self):
+        """Import matplotlib and build the figure (first render only)."""
+        self._matplotlib_loaded = True
+        
         try:
             import sys
             import os
@@ -450,40 +545,46 @@ class ChartWidget(tk.Frame):
             
             self.Figure = Figure
             self.FigureCanvasTkAgg = FigureCanvasTkAgg
-            self.has_matplotlib = True
             
             # Create figure
             self.figure = Figure(figsize=(5, 3), dpi=80, facecolor=Colors.BG_SECONDARY)
             self.subplot = self.figure.add_subplot(111)
-            self.subplot.set_title(title, fontsize=10, color=Colors.TEXT_PRIMARY)
+            self.subplot.set_title(self.title, fontsize=10, color=Colors.TEXT_PRIMARY)
             self.subplot.set_facecolor(Colors.BG_PRIMARY)
+            self.subplot.grid(True, alpha=0.2, linestyle='--', linewidth=0.5)
+            self.subplot.tick_params(labelsize=8)
+            self._empty_text = self.subplot.text(
+                0.5, 0.5, 'No data yet\nStart server to see activity',
+                ha='center', va='center', transform=self.subplot.transAxes,
+                fontsize=9, color=Colors.TEXT_SECONDARY
+            )
             
             # Create canvas
             self.canvas = FigureCanvasTkAgg(self.figure, self)
+            self.text_label.destroy()
+            self.text_label = None
             self.canvas.get_tk_widget().pack(fill=tk.BOTH, expand=True)
+            self.has_matplotlib = True
             
-            print(f"[INFO] Chart widget '{title}' initialized with matplotlib")
+            print(f"[INFO] Chart widget '{self.title}' initialized with matplotlib")
             
         except Exception as e:
-            print(f"[WARNING] matplotlib not available for '{title}': {e}")
+            print(f"[WARNING] matplotlib not available for '{self.title}': {e}")
             # Fallback to text display
-            self.text_label = tk.Label(
-                self,
-                text=f"{title}\n(Matplotlib not available)\nData will show as text",
-                font=(Fonts.FAMILY_DEFAULT, Fonts.SIZE_SMALL),
-                fg=Colors.TEXT_SECONDARY,
-                bg=Colors.BG_SECONDARY,
-                justify=tk.CENTER
+            self.text_label.config(
+                text=f"{self.title}\n(Matplotlib not available)\nData will show as text"
             )
-            self.text_label.pack(fill=tk.BOTH, expand=True)
     
     def update_data(self, data: List, labels: Optional[List] = None):
         """Update chart data."""
         self.data = data
         
+        if not self._matplotlib_loaded:
+            self._load_matplotlib()
+        
         if not self.has_matplotlib:
             # Update text display
-            if hasattr(self, 'text_label'):
+            if self.text_label is not None:
                 summary = f"{self.title}\n\n"
                 if data and len(data) > 0:
                     summary += f"Latest: {data[-1] if data else 0}\n"
@@ -495,39 +596,75 @@ class ChartWidget(tk.Frame):
                 self.text_label.config(text=summary)
             return
         
+        # Nothing changed since the last render
+        if self._drawn == (data, labels):
+            return
+        
         try:
-            # Clear and redraw
-            self.subplot.clear()
-            self.subplot.set_title(self.title, fontsize=10, color=Colors.TEXT_PRIMARY)
-            self.subplot.set_facecolor(Colors.BG_PRIMARY)
+            has_data = bool(data)
+            self._empty_text.set_text('No data yet\nStart server to see activity')
+            self._empty_text.set_color(Colors.TEXT_SECONDARY)
+            self._empty_text.set_visible(not has_data)
             
-            # Only draw if we have data
-            if not data or len(data) == 0:
-                self.subplot.text(0.5, 0.5, 'No data yet\nStart server to see activity',
-                                ha='center', va='center', transform=self.subplot.transAxes,
-                                fontsize=9, color=Colors.TEXT_SECONDARY)
-            elif self.chart_type == "line":
-                self.subplot.plot(data, color=Colors.PRIMARY, linewidth=2)
-                self.subplot.fill_between(range(len(data)), data, alpha=0.3, color=Colors.PRIMARY_LIGHT)
-            elif self.chart_type == "bar" and labels:
-                bars = self.subplot.bar(range(len(data)), data, color=Colors.PRIMARY)
-                if labels and len(labels) == len(data):
-                    self.subplot.set_xticks(range(len(labels)))
-                    # Limit label length for readability
-                    short_labels = [lbl[:12] + '...' if len(lbl) > 12 else lbl for lbl in labels]
-                    self.subplot.set_xticklabels(short_labels, rotation=45, ha='right', fontsize=8)
+            if self.chart_type == "line":
+                self._draw_line(data)
+            elif self.chart_type == "bar":
+                self._draw_bars(data if labels else [], labels)
             
-            self.subplot.grid(True, alpha=0.2, linestyle='--', linewidth=0.5)
-            self.subplot.tick_params(labelsize=8)
-            self.figure.tight_layout()
-            self.canvas.draw()
+            # Layout only depends on the tick labels
+            if self._drawn is None or self._drawn[1] != labels:
+                self.figure.tight_layout()
+            self._drawn = (data, labels)
+            self.canvas.draw_idle()
             
         except Exception as e:
             print(f"[ERROR] Chart update error: {e}")
             # Show error in chart
-            if hasattr(self, 'subplot'):
-                self.subplot.clear()
-                self.subplot.text(0.5, 0.5, f'Chart error:\n{str(e)[:50]}',
-                                ha='center', va='center', transform=self.subplot.transAxes,
-                                fontsize=8, color=Colors.ERROR)
+            self._drawn = None
+            if self._empty_text is not None:
+                self._empty_text.set_text(f'Chart error:\n{str(e)[:50]}')
+                self._empty_text.set_color(Colors.ERROR)
+                self._empty_text.set_visible(True)
+                self.canvas.draw_idle()
+    
+    def _draw_line(self, data: List):
+        """Move the existing line to the new points; only the fill is rebuilt."""
+        x = range(len(data))
+        if self._line is None:
+            self._line, = self.subplot.plot(x, data, color=Colors.PRIMARY, linewidth=2)
+        else:
+            self._line.set_data(x, data)
+        
+        if self._fill is not None:
+            self._fill.remove()
+            self._fill = None
+        
+        self._line.set_visible(bool(data))
+        if data:
+            self._fill = self.subplot.fill_between(x, data, alpha=0.3, color=Colors.PRIMARY_LIGHT)
+            self.subplot.set_xlim(0, max(len(data) - 1, 1))
+            self.subplot.set_ylim(0, max(data) * 1.1 or 1)
+    
+    def _draw_bars(self, data: List, labels: Optional[List]):
+        """Resize existing bars in place; recreate them only when the count changes."""
+        if self._bars is not None and len(self._bars) == len(data):
+            for bar, height in zip(self._bars, data):
+                bar.set_height(height)
+        else:
+            if self._bars is not None:
+                self._bars.remove()
+                self._bars = None
+            if data:
+                self._bars = self.subplot.bar(range(len(data)), data, color=Colors.PRIMARY)
+                self.subplot.set_xticks(range(len(data)))
+                self.subplot.set_xlim(-0.5, len(data) - 0.5)
+            else:
+                self.subplot.set_xticks([])
+        
+        if data:
+            if labels and len(labels) == len(data):
+                # Limit label length for readability
+                short_labels = [lbl[:12] + '...' if len(lbl) > 12 else lbl for lbl in labels]
+                self.subplot.set_xticklabels(short_labels, rotation=45, ha='right', fontsize=8)
+            self.subplot.set_ylim(0, max(data) * 1.1 or 1)
 